@@ -39,6 +39,11 @@ from ..context import RoarContext
     is_flag=True,
     help="Show all build tool, pip, and dpkg packages that will be installed (no truncation)",
 )
+@click.option(
+    "--git-cache",
+    is_flag=True,
+    help="Clone through a reusable git mirror cache in ~/.roar/cache/git",
+)
 @click.option(
     "--out",
     "out_path",
@@ -56,6 +61,7 @@ def reproduce(
     pip_any_version: bool,
     package_sync: bool,
     list_requirements: bool,
+    git_cache: bool,
     out_path: str | None,
 ) -> None:
     """Reproduce an artifact from its hash.
@@ -115,6 +121,7 @@ def reproduce(
     service = ReproductionService(
         glaas_client=glaas_client,
         presenter=presenter,
+        use_git_cache=git_cache,
     )
 
     # Default behavior: show preview with copy-paste command
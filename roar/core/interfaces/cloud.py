@@ -116,6 +116,25 @@ class ICloudStorageProvider(ABC):
         """
         pass
 
+    def exists(self, url: str) -> bool:
+        """
+        Check whether an object exists at a cloud URL.
+
+        The default lists the URL and looks for an exact match; providers
+        with a cheaper native check should override it.
+
+        Args:
+            url: Cloud URL of the object
+
+        Returns:
+            True if the object exists, False if not or if listing failed
+        """
+        ok, objects, _error = self.list_objects(url)
+        if not ok:
+            return False
+        _bucket, key = self.parse_url(url)
+        return any(obj in (url, key) for obj in objects)
+
     @abstractmethod
     def upload_batch(
         self,
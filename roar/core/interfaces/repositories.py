@@ -5,6 +5,7 @@ These protocols define focused interfaces for data access operations,
 following the Interface Segregation Principle (ISP).
 """
 
+from collections.abc import Iterable
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -32,10 +33,20 @@ class ArtifactRepository(Protocol):
         """Get artifact by hash digest (full or prefix)."""
         ...
 
+    def get_many_by_hash(
+        self, digests: Iterable[str], algorithm: str = "blake3"
+    ) -> dict[str, dict[str, Any]]:
+        """Get artifacts for many full digests at once, keyed by digest."""
+        ...
+
     def get_hashes(self, artifact_id: str) -> list[dict[str, Any]]:
         """Get all hashes for an artifact."""
         ...
 
+    def get_hashes_for_many(self, artifact_ids: Iterable[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get hashes for many artifacts at once, keyed by artifact ID."""
+        ...
+
     def get_locations(self, artifact_id: str) -> list[dict[str, str]]:
         """Get all known locations for an artifact."""
         ...
@@ -54,6 +65,12 @@ class ArtifactRepository(Protocol):
         """Get jobs that produced or consumed an artifact."""
         ...
 
+    def get_producer_session(
+        self, artifact_id: str
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Get the latest producer job of an artifact and its session."""
+        ...
+
     def get_by_path(self, path: str) -> dict[str, Any] | None:
         """Get artifact by file path."""
         ...
@@ -99,6 +116,16 @@ class JobRepository(Protocol):
         """Get job output artifacts."""
         ...
 
+    def get_io_for_jobs(
+        self, job_ids: Iterable[int], artifact_repo: "ArtifactRepository"
+    ) -> dict[int, dict[str, list[dict[str, Any]]]]:
+        """Get inputs and outputs for many jobs at once, keyed by job ID."""
+        ...
+
+    def get_latest_per_io_signature(self, job_ids: Iterable[int]) -> set[int]:
+        """Get IDs of the latest job per input/output signature (re-run dedup)."""
+        ...
+
     def add_input(self, job_id: int, artifact_id: str, path: str) -> None:
         """Add input artifact to job."""
         ...
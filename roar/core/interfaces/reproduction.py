@@ -4,6 +4,7 @@ Reproduction service interfaces.
 Defines protocols for artifact reproduction services.
 """
 
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol, runtime_checkable
@@ -21,7 +22,7 @@ class ReproductionResult:
     warnings: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineInfo:
     """Information about a pipeline to reproduce."""
 
@@ -33,7 +34,7 @@ class PipelineInfo:
     total_steps: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentInfo:
     """Information about a reproduction environment."""
 
@@ -41,6 +42,9 @@ class EnvironmentInfo:
     venv_dir: Path | None
     python_version: str | None
     packages: list[str] = field(default_factory=list)
+    # Pending pip install of run-step packages when installation overlaps
+    # with build step execution; resolves to (success, warnings).
+    install_future: "Future[tuple[bool, list[str]]] | None" = None
 
 
 @runtime_checkable
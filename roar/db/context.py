@@ -51,6 +51,7 @@ class DatabaseContext:
         """
         self.db_path = db_path
         self._engine: Engine | None = None
+        self._owns_engine = True
         self._session: Session | None = None
         self._hash_registry = HashAlgorithmRegistry()
 
@@ -69,10 +70,39 @@ class DatabaseContext:
 
     def connect(self) -> None:
         """Connect to the database and initialize schema if needed."""
+        if self._session is not None:
+            return  # already bound, e.g. a sibling context
         self._engine = create_roar_engine(self.db_path)
         init_database(self._engine)
-        session_factory = create_session_factory(self._engine)
-        self._session = session_factory()
+        self._bind(create_session_factory(self._engine)())
+
+    def sibling(self) -> "DatabaseContext":
+        """
+        Create a context with its own session on this context's engine.
+
+        The sibling skips engine creation and schema initialization, and
+        checks out a separate connection, so it can be used from another
+        thread while this context is busy. It must be closed before this
+        context is.
+
+        Returns:
+            Connected DatabaseContext (use as context manager)
+        """
+        engine = self._engine
+        if engine is None:
+            raise DatabaseConnectionError(
+                "DatabaseContext not connected. Use as context manager.",
+                db_path=str(self.db_path),
+            )
+        sibling = DatabaseContext(self.db_path)
+        sibling._engine = engine
+        sibling._owns_engine = False
+        sibling._bind(create_session_factory(engine)())
+        return sibling
+
+    def _bind(self, session: Session) -> None:
+        """Initialize repositories and services on a database session."""
+        self._session = session
 
         # Initialize repositories
         self._hash_cache_repo = SQLAlchemyHashCacheRepository(self._session)
@@ -102,7 +132,8 @@ class DatabaseContext:
             self._session.close()
             self._session = None
         if self._engine:
-            self._engine.dispose()
+            if self._owns_engine:
+                self._engine.dispose()
             self._engine = None
 
     def commit(self) -> None:
@@ -7,6 +7,7 @@ Handles artifact storage and retrieval operations.
 import json
 import secrets
 import time
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy import delete, func, select
@@ -14,6 +15,26 @@ from sqlalchemy.orm import Session
 
 from ...core.interfaces.repositories import ArtifactRepository
 from ..models import Artifact, ArtifactHash, Job, JobInput, JobOutput
+from ..models import Session as SessionModel
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_IN_CLAUSE_CHUNK = 500
+
+
+def hashes_by_algorithm(hashes: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    Index a hashes list by algorithm for O(1) digest lookup.
+
+    Args:
+        hashes: List of {algorithm, digest} dicts
+
+    Returns:
+        Dict of {algorithm: digest}; the first digest wins per algorithm.
+    """
+    by_alg: dict[str, str] = {}
+    for h in hashes:
+        by_alg.setdefault(h["algorithm"], h["digest"])
+    return by_alg
 
 
 class SQLAlchemyArtifactRepository(ArtifactRepository):
@@ -121,6 +142,7 @@ class SQLAlchemyArtifactRepository(ArtifactRepository):
             return None
         result = self._artifact_to_dict(artifact)
         result["hashes"] = self.get_hashes(artifact_id)
+        result["hashes_by_alg"] = hashes_by_algorithm(result["hashes"])
         return result
 
     def get_hashes(self, artifact_id: str) -> list[dict[str, Any]]:
@@ -187,10 +209,83 @@ class SQLAlchemyArtifactRepository(ArtifactRepository):
         result = self._artifact_to_dict(artifact)
         hashes = self.get_hashes(artifact.id)
         result["hashes"] = hashes
+        result["hashes_by_alg"] = hashes_by_algorithm(hashes)
         # Backward compatibility: hash is the primary hash digest
         result["hash"] = hashes[0]["digest"] if hashes else None
         return result
 
+    def get_many_by_hash(
+        self, digests: Iterable[str], algorithm: str = "blake3"
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get artifacts for many full hash digests in a single round-trip.
+
+        Unlike get_by_hash(), digests must be complete (no prefix matching).
+
+        Args:
+            digests: Full hash digests to look up
+            algorithm: Hash algorithm the digests belong to
+
+        Returns:
+            Dict mapping each found digest to its artifact dict (with hashes).
+            Digests with no matching artifact are omitted.
+        """
+        wanted = sorted({d.lower() for d in digests})
+        if not wanted:
+            return {}
+
+        rows: list[tuple[str, Artifact]] = []
+        for start in range(0, len(wanted), _IN_CLAUSE_CHUNK):
+            chunk = wanted[start : start + _IN_CLAUSE_CHUNK]
+            rows.extend(
+                self._session.execute(
+                    select(ArtifactHash.digest, Artifact)
+                    .join(Artifact, ArtifactHash.artifact_id == Artifact.id)
+                    .where(ArtifactHash.algorithm == algorithm, ArtifactHash.digest.in_(chunk))
+                )
+                .tuples()
+                .all()
+            )
+
+        hashes_by_artifact = self.get_hashes_for_many({a.id for _, a in rows})
+
+        results: dict[str, dict[str, Any]] = {}
+        for digest, artifact in rows:
+            result = self._artifact_to_dict(artifact)
+            hashes = hashes_by_artifact.get(artifact.id, [])
+            result["hashes"] = hashes
+            result["hashes_by_alg"] = hashes_by_algorithm(hashes)
+            result["hash"] = hashes[0]["digest"] if hashes else None
+            results[digest] = result
+        return results
+
+    def get_hashes_for_many(self, artifact_ids: Iterable[str]) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get hashes for several artifacts in a single round-trip.
+
+        Args:
+            artifact_ids: Artifact UUIDs
+
+        Returns:
+            Dict mapping artifact ID to its list of hash dicts.
+        """
+        ids = sorted(set(artifact_ids))
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            chunk = ids[start : start + _IN_CLAUSE_CHUNK]
+            hashes = (
+                self._session.execute(
+                    select(ArtifactHash).where(ArtifactHash.artifact_id.in_(chunk))
+                )
+                .scalars()
+                .all()
+            )
+            for h in hashes:
+                grouped.setdefault(h.artifact_id, []).append(
+                    {"algorithm": h.algorithm, "digest": h.digest}
+                )
+        return grouped
+
     def get_by_prefix(self, hash_prefix: str) -> dict[str, Any] | None:
         """
         Get artifact by hash prefix.
@@ -453,6 +548,36 @@ class SQLAlchemyArtifactRepository(ArtifactRepository):
             "consumed_by": [self._job_to_dict(j) for j in consumed_by],
         }
 
+    def get_producer_session(
+        self, artifact_id: str
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """
+        Get the latest job that produced an artifact together with its session.
+
+        Single-query equivalent of ``get_jobs(artifact_id)["produced_by"][0]``
+        followed by a session lookup.
+
+        Args:
+            artifact_id: Artifact UUID
+
+        Returns:
+            Tuple of (producer job dict, session dict). The producer is None if
+            nothing produced the artifact; the session is None if the producer
+            has no session.
+        """
+        row = self._session.execute(
+            select(Job, SessionModel)
+            .join(JobOutput, Job.id == JobOutput.job_id)
+            .outerjoin(SessionModel, SessionModel.id == Job.session_id)
+            .where(JobOutput.artifact_id == artifact_id)
+            .order_by(Job.timestamp.desc())
+            .limit(1)
+        ).first()
+        if row is None:
+            return None, None
+        job, session = row
+        return self._job_to_dict(job), self._session_to_dict(session) if session else None
+
     def delete_hashes(self, artifact_id: str) -> None:
         """
         Delete all hashes for an artifact.
@@ -487,6 +612,22 @@ class SQLAlchemyArtifactRepository(ArtifactRepository):
             "metadata": artifact.metadata_,
         }
 
+    def _session_to_dict(self, session: SessionModel) -> dict[str, Any]:
+        """Convert Session model to dict."""
+        return {
+            "id": session.id,
+            "hash": session.hash,
+            "created_at": session.created_at,
+            "source_artifact_hash": session.source_artifact_hash,
+            "current_step": session.current_step,
+            "is_active": session.is_active,
+            "git_repo": session.git_repo,
+            "git_commit_start": session.git_commit_start,
+            "git_commit_end": session.git_commit_end,
+            "synced_at": session.synced_at,
+            "metadata": session.metadata_,
+        }
+
     def _job_to_dict(self, job: Job) -> dict[str, Any]:
         """Convert Job model to dict."""
         return {
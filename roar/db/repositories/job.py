@@ -4,8 +4,10 @@ SQLAlchemy job repository implementation.
 Handles job recording and retrieval operations.
 """
 
+import json
 import os
 import secrets
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy import delete, select, text
@@ -15,6 +17,10 @@ from ...core.di import resolve_or_default
 from ...core.interfaces.logger import ILogger
 from ...core.interfaces.repositories import JobRepository
 from ..models import Artifact, CollectionMember, Job, JobInput, JobOutput
+from .artifact import hashes_by_algorithm
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_IN_CLAUSE_CHUNK = 500
 
 
 class SQLAlchemyJobRepository(JobRepository):
@@ -231,6 +237,7 @@ class SQLAlchemyJobRepository(JobRepository):
                     "artifact_id": artifact_id,
                     "size": size,
                     "hashes": hashes,
+                    "hashes_by_alg": hashes_by_algorithm(hashes),
                     # Backward compatibility: artifact_hash is the primary hash digest
                     "artifact_hash": hashes[0]["digest"] if hashes else None,
                     "first_seen_path": first_seen_path,
@@ -265,6 +272,7 @@ class SQLAlchemyJobRepository(JobRepository):
                     "artifact_id": artifact_id,
                     "size": size,
                     "hashes": hashes,
+                    "hashes_by_alg": hashes_by_algorithm(hashes),
                     # Backward compatibility: artifact_hash is the primary hash digest
                     "artifact_hash": hashes[0]["digest"] if hashes else None,
                     "first_seen_path": first_seen_path,
@@ -272,6 +280,139 @@ class SQLAlchemyJobRepository(JobRepository):
             )
         return results
 
+    def get_io_for_jobs(
+        self, job_ids: Iterable[int], artifact_repo
+    ) -> dict[int, dict[str, list[dict[str, Any]]]]:
+        """
+        Get input and output artifacts for many jobs in a few round-trips.
+
+        Bulk equivalent of calling get_inputs() and get_outputs() per job.
+
+        Args:
+            job_ids: Job database IDs
+            artifact_repo: Artifact repository for fetching hashes
+
+        Returns:
+            Dict mapping job ID to {"inputs": [...], "outputs": [...]}, where
+            each entry has the same shape as get_inputs()/get_outputs().
+            Every requested job ID is present, even without any I/O.
+        """
+        ids = sorted(set(job_ids))
+        grouped: dict[int, dict[str, list[dict[str, Any]]]] = {
+            job_id: {"inputs": [], "outputs": []} for job_id in ids
+        }
+        rows: list[tuple[str, Any]] = []
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            chunk = ids[start : start + _IN_CLAUSE_CHUNK]
+            for direction, model in (("inputs", JobInput), ("outputs", JobOutput)):
+                query = (
+                    select(
+                        model.job_id,
+                        model.path,
+                        model.artifact_id,
+                        Artifact.size,
+                        Artifact.first_seen_path,
+                    )
+                    .join(Artifact, model.artifact_id == Artifact.id)
+                    .where(model.job_id.in_(chunk))
+                )
+                rows.extend((direction, row) for row in self._session.execute(query).all())
+
+        hashes_by_artifact = artifact_repo.get_hashes_for_many(row[2] for _, row in rows)
+
+        for direction, (job_id, path, artifact_id, size, first_seen_path) in rows:
+            hashes = hashes_by_artifact.get(artifact_id, [])
+            grouped[job_id][direction].append(
+                {
+                    "path": path or first_seen_path,  # Use artifact path as fallback
+                    "artifact_id": artifact_id,
+                    "size": size,
+                    "hashes": hashes,
+                    "hashes_by_alg": hashes_by_algorithm(hashes),
+                    # Backward compatibility: artifact_hash is the primary hash digest
+                    "artifact_hash": hashes[0]["digest"] if hashes else None,
+                    "first_seen_path": first_seen_path,
+                }
+            )
+        return grouped
+
+    def get_latest_per_io_signature(self, job_ids: Iterable[int]) -> set[int]:
+        """
+        Deduplicate re-runs in SQL, keeping the latest job per I/O signature.
+
+        A job's signature is its sorted BLAKE3 input digests plus its sorted
+        BLAKE3 output digests. Jobs with neither are never considered re-runs.
+        Among re-runs with the same timestamp, the one listed first in
+        ``job_ids`` is kept.
+
+        Args:
+            job_ids: Job database IDs to deduplicate among, in priority order
+
+        Returns:
+            IDs of the jobs to keep (latest per signature).
+        """
+        # Job IDs travel as a single JSON parameter so the IN lists are not
+        # bounded by SQLite's host-parameter limit; the array index doubles
+        # as the tie-break position. group_concat() runs as a window function
+        # because only its OVER clause guarantees concatenation order before
+        # SQLite 3.44.
+        rows = self._session.execute(
+            text("""
+                WITH ids AS (
+                    SELECT value AS id, key AS pos FROM json_each(:ids)
+                ),
+                ins AS (
+                    SELECT DISTINCT
+                        ji.job_id,
+                        group_concat(h.digest, ',') OVER (
+                            PARTITION BY ji.job_id ORDER BY h.digest
+                            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                        ) AS sig
+                    FROM job_inputs ji
+                    JOIN artifact_hashes h
+                        ON h.artifact_id = ji.artifact_id AND h.algorithm = 'blake3'
+                    WHERE ji.job_id IN (SELECT id FROM ids)
+                ),
+                outs AS (
+                    SELECT DISTINCT
+                        jo.job_id,
+                        group_concat(h.digest, ',') OVER (
+                            PARTITION BY jo.job_id ORDER BY h.digest
+                            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                        ) AS sig
+                    FROM job_outputs jo
+                    JOIN artifact_hashes h
+                        ON h.artifact_id = jo.artifact_id AND h.algorithm = 'blake3'
+                    WHERE jo.job_id IN (SELECT id FROM ids)
+                ),
+                sigs AS (
+                    SELECT
+                        j.id,
+                        j.timestamp,
+                        ids.pos,
+                        CASE
+                            WHEN ins.sig IS NULL AND outs.sig IS NULL THEN 'unique:' || j.id
+                            ELSE coalesce(ins.sig, '') || '|' || coalesce(outs.sig, '')
+                        END AS sig
+                    FROM jobs j
+                    JOIN ids ON ids.id = j.id
+                    LEFT JOIN ins ON ins.job_id = j.id
+                    LEFT JOIN outs ON outs.job_id = j.id
+                )
+                SELECT id FROM (
+                    SELECT
+                        id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY sig ORDER BY timestamp DESC, pos ASC
+                        ) AS rn
+                    FROM sigs
+                )
+                WHERE rn = 1
+            """),
+            {"ids": json.dumps(list(dict.fromkeys(job_ids)))},
+        )
+        return {row[0] for row in rows}
+
     def get_recent(self, limit: int = 50) -> list[dict[str, Any]]:
         """
         Get most recent jobs.
@@ -4,12 +4,62 @@ Default lineage service implementation.
 Provides lineage tracing and DAG reconstruction operations.
 """
 
+import sys
 from typing import Any
 
 from ...core.interfaces.repositories import ArtifactRepository, JobRepository
 from ...core.interfaces.services import LineageService
 
 
+def get_blake3(item: dict[str, Any]) -> str | None:
+    """
+    Extract BLAKE3 hash from an artifact item.
+
+    Uses the repository's 'hashes_by_alg' index when present and
+    falls back to scanning the 'hashes' list.
+
+    Args:
+        item: Dict with 'hashes_by_alg' index and/or 'hashes' list
+
+    Returns:
+        BLAKE3 digest or None.
+    """
+    by_alg = item.get("hashes_by_alg")
+    if by_alg is not None:
+        return by_alg.get("blake3")
+    for h in item.get("hashes", []):
+        if h.get("algorithm") == "blake3":
+            return h.get("digest")
+    return None
+
+
+def resolve_io(items: list[dict[str, Any]]) -> tuple[list[str], list[dict[str, str]]]:
+    """
+    Resolve artifact items to hash-only and structured I/O views.
+
+    Each item's BLAKE3 digest is looked up once and interned, so repeated
+    digests across jobs share a string. Both views keep the items' order.
+
+    Args:
+        items: Dicts with 'hashes' lists and 'path'/'first_seen_path'
+
+    Returns:
+        Tuple of (BLAKE3 digests, list of {hash, path} dicts).
+        Items without a BLAKE3 digest are skipped.
+    """
+    entries = []
+    for item in items:
+        h = get_blake3(item)
+        if h:
+            entries.append(
+                {
+                    "hash": sys.intern(h),
+                    "path": item.get("path") or item.get("first_seen_path", ""),
+                }
+            )
+    return [e["hash"] for e in entries], entries
+
+
 class DefaultLineageService(LineageService):
     """
     Default implementation of lineage service.
@@ -140,15 +190,8 @@ class DefaultLineageService(LineageService):
                 # Get inputs and trace upstream
                 inputs = self._job_repo.get_inputs(producer["id"], self._artifact_repo)
                 job_dict["_input_artifact_ids"] = [inp["artifact_id"] for inp in inputs]
-                job_dict["_input_hashes"] = [
-                    h for h in (self._get_blake3(inp) for inp in inputs) if h
-                ]
-                # Structured inputs with hash and path
-                job_dict["_inputs"] = [
-                    {"hash": h, "path": inp.get("path") or inp.get("first_seen_path", "")}
-                    for inp in inputs
-                    if (h := self._get_blake3(inp))
-                ]
+                # Hash-only and structured (hash + path) inputs
+                job_dict["_input_hashes"], job_dict["_inputs"] = resolve_io(inputs)
 
                 for inp in inputs:
                     trace_upstream(inp["artifact_id"], current_depth + 1)
@@ -156,15 +199,7 @@ class DefaultLineageService(LineageService):
                 # Get outputs
                 outputs = self._job_repo.get_outputs(producer["id"], self._artifact_repo)
                 job_dict["_output_artifact_ids"] = [out["artifact_id"] for out in outputs]
-                job_dict["_output_hashes"] = [
-                    h for h in (self._get_blake3(out) for out in outputs) if h
-                ]
-                # Structured outputs with hash and path
-                job_dict["_outputs"] = [
-                    {"hash": h, "path": out.get("path") or out.get("first_seen_path", "")}
-                    for out in outputs
-                    if (h := self._get_blake3(out))
-                ]
+                job_dict["_output_hashes"], job_dict["_outputs"] = resolve_io(outputs)
 
                 jobs.append(job_dict)
 
@@ -203,7 +238,7 @@ class DefaultLineageService(LineageService):
             else:
                 return None, [], set()
 
-        target_hash = self._get_blake3(artifact)
+        target_hash = get_blake3(artifact)
         if not target_hash:
             return None, [], set()
 
@@ -231,7 +266,7 @@ class DefaultLineageService(LineageService):
                 job_dict["_all_inputs"] = inputs
 
                 for inp in inputs:
-                    inp_hash = self._get_blake3(inp)
+                    inp_hash = get_blake3(inp)
                     if inp_hash:
                         on_path_hashes.add(inp_hash)
                     # Recursively trace upstream
@@ -249,7 +284,7 @@ class DefaultLineageService(LineageService):
         for job in jobs:
             job["_inputs"] = []
             for inp in job.get("_all_inputs", []):
-                inp_hash = self._get_blake3(inp)
+                inp_hash = get_blake3(inp)
                 if inp_hash and inp_hash in on_path_hashes:
                     job["_inputs"].append(
                         {
@@ -261,7 +296,7 @@ class DefaultLineageService(LineageService):
 
             job["_outputs"] = []
             for out in job.get("_all_outputs", []):
-                out_hash = self._get_blake3(out)
+                out_hash = get_blake3(out)
                 if out_hash and out_hash in on_path_hashes:
                     job["_outputs"].append(
                         {
@@ -279,19 +314,3 @@ class DefaultLineageService(LineageService):
         jobs.sort(key=lambda j: j["timestamp"])
 
         return artifact, jobs, on_path_hashes
-
-    @staticmethod
-    def _get_blake3(item: dict[str, Any]) -> str | None:
-        """
-        Extract BLAKE3 hash from an artifact item.
-
-        Args:
-            item: Dict with 'hashes' list
-
-        Returns:
-            BLAKE3 digest or None.
-        """
-        for h in item.get("hashes", []):
-            if h.get("algorithm") == "blake3":
-                return h.get("digest")
-        return None
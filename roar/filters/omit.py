@@ -153,6 +153,26 @@ BUILTIN_PATTERNS: list[tuple[str, re.Pattern, str]] = [
 ]
 
 
+def _any_match_regex(patterns: list[tuple[str, re.Pattern, str]]) -> re.Pattern:
+    """
+    Combine patterns into one alternation that matches wherever any of them does.
+
+    Only used to test whether a text needs filtering at all: groups keep
+    their meaning inside each branch, and each branch keeps its
+    case-insensitivity as a scoped inline flag.
+    """
+    branches = []
+    for _, pattern, _ in patterns:
+        flags = "i" if pattern.flags & re.IGNORECASE else ""
+        branches.append(f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})")
+    return re.compile("|".join(branches))
+
+
+# One scan tells whether any built-in pattern can match; most text has no
+# secrets, so this skips the per-pattern passes in the common case.
+_BUILTIN_ANY_MATCH = _any_match_regex(BUILTIN_PATTERNS)
+
+
 class OmitFilter:
     """
     Filters sensitive data from registration payloads.
@@ -184,6 +204,13 @@ class OmitFilter:
         # Load explicit secrets to redact
         secrets_config = config.get("secrets", {})
         self.explicit_secrets: list[str] = secrets_config.get("values", [])
+        # All literal secrets in one alternation (longest first, so a secret
+        # containing another wins) to scan the text once instead of once per
+        # secret; None when there is nothing to redact.
+        literals = sorted({s for s in self.explicit_secrets if s}, key=len, reverse=True)
+        self._explicit_secrets_re: re.Pattern | None = (
+            re.compile("|".join(re.escape(s) for s in literals)) if literals else None
+        )
 
         # Load env var names whose values should be redacted
         env_vars_config = config.get("env_vars", {})
@@ -212,21 +239,30 @@ class OmitFilter:
         return any(pattern.search(text) for pattern in self.allowlist)
 
     def _redact_explicit_secrets(self, text: str, field: str = "") -> tuple[str, list[OmitMatch]]:
-        """Redact explicit secrets from text."""
-        detections = []
-        result = text
-
-        for secret in self.explicit_secrets:
-            if secret and secret in result:
-                detections.append(
-                    OmitMatch(
-                        pattern_id="explicit_secret",
-                        original_length=len(secret),
-                        field=field,
-                    )
-                )
-                result = result.replace(secret, "[REDACTED]")
-
+        """Redact explicit secrets from text in a single pass."""
+        if self._explicit_secrets_re is None:
+            return text, []
+
+        found: set[str] = set()
+
+        def _redact(match: re.Match) -> str:
+            found.add(match.group(0))
+            return "[REDACTED]"
+
+        result = self._explicit_secrets_re.sub(_redact, text)
+        if not found:
+            return text, []
+
+        # One detection per distinct secret, in configured order
+        detections = [
+            OmitMatch(
+                pattern_id="explicit_secret",
+                original_length=len(secret),
+                field=field,
+            )
+            for secret in dict.fromkeys(self.explicit_secrets)
+            if secret in found
+        ]
         return result, detections
 
     def _apply_patterns(
@@ -234,8 +270,17 @@ class OmitFilter:
         text: str,
         patterns: list[tuple[str, re.Pattern, str]],
         field: str = "",
+        any_match: re.Pattern | None = None,
     ) -> tuple[str, list[OmitMatch]]:
-        """Apply regex patterns to redact secrets."""
+        """
+        Apply regex patterns to redact secrets.
+
+        ``any_match``, when given, must match wherever any of ``patterns``
+        does; text it doesn't match is returned without trying each pattern.
+        """
+        if any_match is not None and not any_match.search(text):
+            return text, []
+
         detections = []
         result = text
 
@@ -289,7 +334,9 @@ class OmitFilter:
         all_detections.extend(explicit_detections)
 
         # Apply built-in patterns
-        result, builtin_detections = self._apply_patterns(result, BUILTIN_PATTERNS, field)
+        result, builtin_detections = self._apply_patterns(
+            result, BUILTIN_PATTERNS, field, any_match=_BUILTIN_ANY_MATCH
+        )
         all_detections.extend(builtin_detections)
 
         # Apply custom patterns
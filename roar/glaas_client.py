@@ -8,6 +8,7 @@ import os
 import time
 import urllib.error
 import urllib.request
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -137,8 +138,14 @@ def find_ssh_pubkey() -> tuple[str, str, Path] | None:
     return None
 
 
+@lru_cache(maxsize=8)
 def compute_pubkey_fingerprint(pubkey: str) -> str:
-    """Compute SHA256 fingerprint of an SSH public key."""
+    """
+    Compute SHA256 fingerprint of an SSH public key.
+
+    Cached on the key text: every signed request re-reads the same pubkey,
+    and a rotated key file yields new text and so a fresh fingerprint.
+    """
     parts = pubkey.strip().split()
     if len(parts) < 2:
         raise ValueError("Invalid public key format")
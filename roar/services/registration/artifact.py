@@ -19,9 +19,7 @@ from ...glaas_client import GlaasClient
 MAX_BATCH_SIZE_BYTES = 90 * 1024  # 90KB
 
 
-def _batch_by_size(
-    artifacts: list[dict], max_bytes: int = MAX_BATCH_SIZE_BYTES
-) -> list[list[dict]]:
+def batch_by_size(artifacts: list[dict], max_bytes: int = MAX_BATCH_SIZE_BYTES) -> list[list[dict]]:
     """Split artifacts into batches that fit within max_bytes when JSON-serialized.
 
     Args:
@@ -247,7 +245,7 @@ class ArtifactRegistrationService(IArtifactRegistrar):
         total_success = 0
         total_errors = 0
 
-        batches = _batch_by_size(valid_artifacts)
+        batches = batch_by_size(valid_artifacts)
         total_batches = len(batches)
         self._logger.debug(
             "Split %d valid artifacts into %d batches for registration",
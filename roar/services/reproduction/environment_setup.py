@@ -6,11 +6,15 @@ This service handles git cloning, virtual environment creation, and
 package installation for reproduction.
 """
 
+import hashlib
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -37,10 +41,15 @@ class EnvironmentSetupService:
         env = service.setup(pipeline, target_dir, auto_confirm=True)
     """
 
+    # Opt-in user-level mirrors of cloned repos (see git_cache_dir) are
+    # pruned once unused for this long
+    GIT_CACHE_MAX_AGE_DAYS = 7
+
     def __init__(
         self,
         presenter: "IPresenter | None" = None,
         roar_executable: str | None = None,
+        use_git_cache: bool = False,
     ):
         """
         Initialize environment setup service.
@@ -48,12 +57,23 @@ class EnvironmentSetupService:
         Args:
             presenter: Presenter for user feedback
             roar_executable: Path to roar executable for initialization
+            use_git_cache: Clone via the user-level mirror cache (git_cache_dir)
         """
         self._presenter = presenter
+        self._use_git_cache = use_git_cache
         self._use_uv = self._check_uv_available()
         self._roar_executable = roar_executable or self._detect_roar_executable()
         self._logger: ILogger | None = None
 
+    @property
+    def git_cache_dir(self) -> Path:
+        """
+        Directory of user-level repo mirrors, keyed by sha1(repo_url).
+
+        Resolved on each use so HOME changes are honoured.
+        """
+        return Path.home() / ".roar" / "cache" / "git"
+
     @property
     def logger(self) -> "ILogger":
         """Lazy-load logger from container."""
@@ -77,6 +97,7 @@ class EnvironmentSetupService:
         dpkg_any_version: bool = False,
         pip_any_version: bool = False,
         package_sync: bool = False,
+        overlap_install: bool = False,
     ) -> "EnvironmentInfo":
         """
         Set up reproduction environment.
@@ -89,6 +110,10 @@ class EnvironmentSetupService:
                 when exact version not found
             pip_any_version: Install any available version of pip packages
                 when exact version not found
+            overlap_install: Install pip packages in a background thread and
+                return immediately; the pending install is exposed as
+                EnvironmentInfo.install_future. Only honoured with auto_confirm,
+                since the install may otherwise prompt.
 
         Returns:
             EnvironmentInfo with setup details
@@ -174,15 +199,29 @@ class EnvironmentSetupService:
             len(packages),
             len(packages),
         )
+        install_future = None
         if packages:
             self.logger.debug("pip packages: %s", packages[:10])
-            success, pip_warnings = self._install_packages(
-                venv_dir, packages, repo_dir, auto_confirm, pip_any_version
-            )
-            if pip_warnings:
-                for w in pip_warnings:
-                    self.logger.warning(w)
-            self.logger.debug("pip installation complete")
+            if overlap_install and auto_confirm:
+                self.logger.debug("Installing pip packages in background")
+                pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="roar-pip")
+                install_future = pool.submit(
+                    self._install_packages,
+                    venv_dir,
+                    packages,
+                    repo_dir,
+                    auto_confirm,
+                    pip_any_version,
+                )
+                pool.shutdown(wait=False)
+            else:
+                success, pip_warnings = self._install_packages(
+                    venv_dir, packages, repo_dir, auto_confirm, pip_any_version
+                )
+                if pip_warnings:
+                    for w in pip_warnings:
+                        self.logger.warning(w)
+                self.logger.debug("pip installation complete")
 
         self.logger.debug("Environment setup complete")
         return EnvironmentInfo(
@@ -190,6 +229,7 @@ class EnvironmentSetupService:
             venv_dir=venv_dir,
             python_version=self._get_python_version(),
             packages=packages,
+            install_future=install_future,
         )
 
     def _is_debian_based(self) -> bool:
@@ -683,14 +723,15 @@ class EnvironmentSetupService:
         else:
             self._print(f"Cloning {git_repo}...")
             try:
-                self._run_git(["clone", git_repo, str(repo_dir)])
+                self._clone(git_repo, repo_dir, use_cache=self._use_git_cache)
             except RuntimeError:
                 if is_ssh_url(git_repo):
                     https_url = ssh_to_https(git_repo)
                     if https_url:
                         self._print("SSH clone failed, trying HTTPS fallback...")
                         self._print(f"Cloning {https_url}...")
-                        self._run_git(["clone", https_url, str(repo_dir)])
+                        # The cache has had its one attempt for this clone
+                        self._clone(https_url, repo_dir, use_cache=False)
                     else:
                         raise
                 else:
@@ -703,6 +744,86 @@ class EnvironmentSetupService:
 
         return repo_dir
 
+    def _clone(self, git_repo: str, repo_dir: Path, use_cache: bool) -> None:
+        """Clone a repository, borrowing objects from the mirror cache if use_cache."""
+        if use_cache and self._clone_from_cache(git_repo, repo_dir):
+            return
+        self._run_git(["clone", git_repo, str(repo_dir)])
+
+    def _clone_from_cache(self, git_repo: str, repo_dir: Path) -> bool:
+        """
+        Clone via a user-level mirror of git_repo, creating it if needed.
+
+        The clone is made with --dissociate so it does not depend on the
+        cache afterwards; the mirror is refreshed only after a successful
+        clone. A failing git command raises RuntimeError, as a plain clone
+        would, so the remote is contacted once per clone attempt. Returns
+        False (leaving repo_dir absent) if the cache itself is unusable, so
+        the caller can fall back to a plain clone.
+        """
+        cache_root = self.git_cache_dir
+        key = hashlib.sha1(git_repo.encode(), usedforsecurity=False).hexdigest()
+        cache_dir = cache_root / key
+        try:
+            if not cache_dir.exists():
+                self._create_git_mirror(git_repo, cache_root, cache_dir)
+            self._run_git(
+                ["clone", "--reference", str(cache_dir), "--dissociate", git_repo, str(repo_dir)]
+            )
+        except RuntimeError:
+            shutil.rmtree(repo_dir, ignore_errors=True)
+            raise
+        except OSError as e:
+            self.logger.debug("Git cache unavailable for %s: %s", git_repo, e)
+            shutil.rmtree(repo_dir, ignore_errors=True)
+            return False
+
+        try:
+            self.logger.debug("Refreshing git cache %s", cache_dir)
+            self._run_git(["fetch", "--prune", "origin"], cwd=cache_dir)
+            os.utime(cache_dir)  # mark as recently used
+        except (RuntimeError, OSError) as e:
+            self.logger.debug("Refreshing git cache %s failed: %s", cache_dir, e)
+        self._prune_git_cache(keep=cache_dir)
+        return True
+
+    def _create_git_mirror(self, git_repo: str, cache_root: Path, cache_dir: Path) -> None:
+        """
+        Create the mirror of git_repo at cache_dir.
+
+        The mirror is built in a temporary sibling directory and moved into
+        place, so concurrent first clones never see or delete each other's
+        half-built mirror; if another process wins, its mirror is kept.
+        """
+        self.logger.debug("Creating git cache %s", cache_dir)
+        cache_root.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{cache_dir.name}-", dir=cache_root))
+        try:
+            self._run_git(["clone", "--mirror", git_repo, str(tmp_dir)])
+            try:
+                os.replace(tmp_dir, cache_dir)
+            except OSError:
+                if not cache_dir.exists():
+                    raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _prune_git_cache(self, keep: Path) -> None:
+        """Remove cached mirrors not used within GIT_CACHE_MAX_AGE_DAYS."""
+        cutoff = time.time() - self.GIT_CACHE_MAX_AGE_DAYS * 86400
+        try:
+            entries = list(keep.parent.iterdir())
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                stale = entry != keep and entry.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            if stale:
+                self.logger.debug("Pruning stale git cache %s", entry)
+                shutil.rmtree(entry, ignore_errors=True)
+
     def _create_venv(self, repo_dir: Path) -> Path:
         """
         Create virtual environment in repository.
@@ -5,13 +5,16 @@ Extracted from reproduce.py to follow Single Responsibility Principle.
 This service handles executing pipeline steps during reproduction.
 """
 
+import json
 import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import Future
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from ...core.interfaces.logger import ILogger
     from ...core.interfaces.presenter import IPresenter
     from ...core.interfaces.reproduction import EnvironmentInfo, PipelineInfo
 
@@ -46,6 +49,22 @@ class PipelineExecutor:
         self._presenter = presenter
         self._roar_initialized = False
         self._roar_executable = roar_executable or self._detect_roar_executable()
+        self._logger: ILogger | None = None
+
+    @property
+    def logger(self) -> "ILogger":
+        """Lazy-load logger from container."""
+        if self._logger is None:
+            from ...core.container import get_container
+            from ...services.logging import NullLogger
+
+            container = get_container()
+            from ...core.interfaces.logger import ILogger
+
+            self._logger = container.try_resolve(ILogger)  # type: ignore[type-abstract]
+            if self._logger is None:
+                self._logger = NullLogger()
+        return self._logger
 
     def execute(
         self,
@@ -58,6 +77,10 @@ class PipelineExecutor:
 
         Runs build steps first, then run steps, in their recorded order.
 
+        If pip packages are still being installed (environment.install_future),
+        build steps wait for the install unless their metadata sets
+        ``requires_packages`` to false; run steps always wait for it.
+
         Args:
             pipeline: Pipeline to execute
             environment: Execution environment with venv path
@@ -66,14 +89,32 @@ class PipelineExecutor:
         Returns:
             Tuple of (steps_run, steps_total)
         """
-        total_steps = len(pipeline.build_steps) + len(pipeline.run_steps)
+        try:
+            return self._execute_steps(pipeline, environment, auto_confirm)
+        finally:
+            # Never leave a background install running past execution
+            self._wait_for_install(environment)
+
+    def _execute_steps(
+        self,
+        pipeline: "PipelineInfo",
+        environment: "EnvironmentInfo",
+        auto_confirm: bool,
+    ) -> tuple[int, int]:
+        """Run build steps then run steps. Returns (steps_run, steps_total)."""
+        build_count = len(pipeline.build_steps)
+        run_count = len(pipeline.run_steps)
+        total_steps = build_count + run_count
         steps_run = 0
 
         # Run build steps first
         if pipeline.build_steps:
-            self._print(f"\nRunning {len(pipeline.build_steps)} build step(s)...")
+            self._print(f"\nRunning {build_count} build step(s)...")
             for i, step in enumerate(pipeline.build_steps, 1):
-                self._print(f"\n[Build {i}/{len(pipeline.build_steps)}]")
+                self._print(f"\n[Build {i}/{build_count}]")
+                # Only steps that explicitly opt out may run alongside the install
+                if self._parse_metadata(step).get("requires_packages", True) is not False:
+                    self._wait_for_install(environment)
                 success = self._run_step(step, environment, is_build=True)
                 if success:
                     steps_run += 1
@@ -83,9 +124,10 @@ class PipelineExecutor:
 
         # Run pipeline steps
         if pipeline.run_steps:
-            self._print(f"\nRunning {len(pipeline.run_steps)} pipeline step(s)...")
+            self._wait_for_install(environment)
+            self._print(f"\nRunning {run_count} pipeline step(s)...")
             for i, step in enumerate(pipeline.run_steps, 1):
-                self._print(f"\n[Step {i}/{len(pipeline.run_steps)}]")
+                self._print(f"\n[Step {i}/{run_count}]")
 
                 # Ask for confirmation if not auto
                 if not auto_confirm:
@@ -140,18 +182,7 @@ class PipelineExecutor:
         self._print(f"  Command: roar {roar_cmd} {command}")
 
         # Extract env vars from step metadata
-        step_env_vars: dict[str, str] = {}
-        metadata = step.get("metadata")
-        if metadata:
-            import json as _json
-
-            if isinstance(metadata, str):
-                try:
-                    metadata = _json.loads(metadata)
-                except (ValueError, TypeError):
-                    metadata = {}
-            if isinstance(metadata, dict):
-                step_env_vars = metadata.get("env_vars", {})
+        step_env_vars: dict[str, str] = self._parse_metadata(step).get("env_vars", {})
 
         # Set up environment
         env = self._prepare_environment(environment, env_vars=step_env_vars)
@@ -181,6 +212,32 @@ class PipelineExecutor:
             self._print(f"  Error: {e}")
             return False
 
+    def _parse_metadata(self, step: dict) -> dict:
+        """Return step metadata as a dict, decoding JSON strings."""
+        metadata = step.get("metadata")
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except (ValueError, TypeError):
+                return {}
+        return metadata if isinstance(metadata, dict) else {}
+
+    def _wait_for_install(self, environment: "EnvironmentInfo") -> None:
+        """Block until a background package install (if any) has finished."""
+        future = getattr(environment, "install_future", None)
+        if not isinstance(future, Future):
+            return
+        environment.install_future = None
+        if not future.done():
+            self._print("\nWaiting for package installation to finish...")
+        try:
+            _success, warnings = future.result()
+        except Exception as e:
+            self._print(f"Package installation failed: {e}")
+            return
+        for warning in warnings:
+            self.logger.warning(warning)
+
     def _wrap_with_roar(
         self,
         command: str,
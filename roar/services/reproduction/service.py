@@ -4,21 +4,67 @@ Reproduction service for orchestrating artifact reproduction.
 Extracted from reproduce.py to follow Single Responsibility Principle.
 """
 
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ...core.interfaces.reproduction import EnvironmentInfo, PipelineInfo, ReproductionResult
 from ...utils.git_url import urls_match
 from .environment_setup import EnvironmentSetupService
 from .pipeline_executor import PipelineExecutor
 
+try:
+    import pygit2 as _pygit2
+
+    pygit2: Any | None = _pygit2
+except ImportError:
+    pygit2 = None
+
 if TYPE_CHECKING:
     from ...core.interfaces.presenter import IPresenter
     from ...glaas_client import GlaasClient
 
+# Environment variables passed through to read-only git probes on Linux,
+# besides every GIT_* and SSH_* variable. Everything else is dropped to keep
+# the spawn cheap; prompts and optional index locks are disabled so
+# concurrent probes never block.
+_GIT_PROBE_PASSTHROUGH = frozenset(
+    {
+        "PATH",
+        "HOME",
+        "XDG_CONFIG_HOME",
+        "LANG",
+        "LC_ALL",
+        "http_proxy",
+        "https_proxy",
+        "no_proxy",
+        "HTTP_PROXY",
+        "HTTPS_PROXY",
+        "NO_PROXY",
+    }
+)
+_GIT_PROBE_PREFIXES = ("GIT_", "SSH_")
+
+
+def _git_probe_env() -> dict[str, str]:
+    """Build the environment for read-only git probes, pruned on Linux only."""
+    if sys.platform.startswith("linux"):
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if key in _GIT_PROBE_PASSTHROUGH or key.startswith(_GIT_PROBE_PREFIXES)
+        }
+    else:
+        env = dict(os.environ)
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    return env
+
 
 class ReproductionService:
     """
@@ -46,6 +92,8 @@ class ReproductionService:
         self,
         glaas_client: "GlaasClient | None" = None,
         presenter: "IPresenter | None" = None,
+        pipeline_install_overlap: bool = False,
+        use_git_cache: bool = False,
     ):
         """
         Initialize reproduction service.
@@ -53,12 +101,21 @@ class ReproductionService:
         Args:
             glaas_client: GLaaS API client
             presenter: Presenter for user feedback
+            pipeline_install_overlap: Install pip packages in the background
+                while build steps run (only when running the pipeline
+                unattended); build steps still wait for the install unless
+                their metadata sets requires_packages to false
+            use_git_cache: Clone through a user-level git mirror cache under
+                ~/.roar/cache/git so repeated reproductions fetch less
         """
         self._glaas = glaas_client
         self._presenter = presenter
+        self._pipeline_install_overlap = pipeline_install_overlap
         # Detect the roar executable once and pass to both services
         roar_exe = self._get_roar_executable()
-        self._env_setup = EnvironmentSetupService(presenter, roar_executable=roar_exe)
+        self._env_setup = EnvironmentSetupService(
+            presenter, roar_executable=roar_exe, use_git_cache=use_git_cache
+        )
         self._executor = PipelineExecutor(presenter, roar_executable=roar_exe)
 
     def reproduce(
@@ -120,18 +177,18 @@ class ReproductionService:
             build_dpkg_packages = self._env_setup._get_build_dpkg_packages(pipeline)
             dpkg_packages = self._env_setup._get_dpkg_packages(pipeline)
             pip_packages = self._env_setup._get_packages(pipeline)
-            if build_dpkg_packages:
-                self._print(f"\nBuild tool packages ({len(build_dpkg_packages)}):")
-                for name in sorted(build_dpkg_packages):
-                    self._print(f"  - {name}")
-            if dpkg_packages:
-                self._print(f"\nSystem packages ({len(dpkg_packages)}):")
-                for name in sorted(dpkg_packages):
-                    self._print(f"  - {name}")
-            if pip_packages:
-                self._print(f"\nPip packages ({len(pip_packages)}):")
-                for pkg in sorted(pip_packages):
-                    self._print(f"  - {pkg}")
+            # Render the whole listing and print it once rather than per package
+            lines: list[str] = []
+            for title, names in (
+                ("Build tool packages", build_dpkg_packages),
+                ("System packages", dpkg_packages),
+                ("Pip packages", pip_packages),
+            ):
+                if names:
+                    lines.append(f"\n{title} ({len(names)}):")
+                    lines.extend(f"  - {name}" for name in sorted(names))
+            if lines:
+                self._print("\n".join(lines))
 
         # Confirm reproduction
         if not auto_confirm:
@@ -165,6 +222,9 @@ class ReproductionService:
                     dpkg_any_version=dpkg_any_version,
                     pip_any_version=pip_any_version,
                     package_sync=package_sync,
+                    overlap_install=(
+                        self._pipeline_install_overlap and run_pipeline and auto_confirm
+                    ),
                 )
             except RuntimeError as e:
                 return ReproductionResult(
@@ -183,24 +243,17 @@ class ReproductionService:
 
             if not auto_confirm:
                 if self._presenter:
-                    if not self._presenter.confirm("Run the pipeline?", default=True):
-                        return ReproductionResult(
-                            success=True,
-                            repo_dir=environment.repo_dir,
-                            steps_run=0,
-                            steps_total=steps_total,
-                            warnings=["Pipeline not executed (user chose to skip)"],
-                        )
+                    confirmed = self._presenter.confirm("Run the pipeline?", default=True)
                 else:
-                    response = input("Run the pipeline? [Y/n] ")
-                    if response.lower() == "n":
-                        return ReproductionResult(
-                            success=True,
-                            repo_dir=environment.repo_dir,
-                            steps_run=0,
-                            steps_total=steps_total,
-                            warnings=["Pipeline not executed (user chose to skip)"],
-                        )
+                    confirmed = input("Run the pipeline? [Y/n] ").lower() != "n"
+                if not confirmed:
+                    return ReproductionResult(
+                        success=True,
+                        repo_dir=environment.repo_dir,
+                        steps_run=0,
+                        steps_total=steps_total,
+                        warnings=["Pipeline not executed (user chose to skip)"],
+                    )
 
             steps_run, steps_total = self._executor.execute(
                 pipeline,
@@ -230,29 +283,15 @@ class ReproductionService:
         Returns:
             EnvironmentInfo if the current repo can be reused, None otherwise.
         """
-        try:
-            repo_root = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                cwd=cwd,
-                check=True,
-            ).stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not pipeline.git_repo:
             return None
 
-        try:
-            origin_url = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                capture_output=True,
-                text=True,
-                cwd=repo_root,
-                check=True,
-            ).stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        probe = self._probe_repo(cwd)
+        if probe is None:
             return None
+        repo_root, origin_url = probe
 
-        if not pipeline.git_repo or not urls_match(origin_url, pipeline.git_repo):
+        if not urls_match(origin_url, pipeline.git_repo):
             return None
 
         self._print("Current repository matches artifact remote, using existing environment")
@@ -283,6 +322,79 @@ class ReproductionService:
             python_version=None,
         )
 
+    def _probe_repo(self, cwd: Path) -> tuple[str, str] | None:
+        """
+        Find the repo root and origin URL for cwd.
+
+        Uses libgit2 in-process when pygit2 is installed, otherwise (or if
+        libgit2 cannot read the repository) shells out to git.
+
+        Returns:
+            Tuple of (repo_root, origin_url), or None if cwd is not inside a
+            git work tree with an origin remote.
+        """
+        if pygit2 is not None:
+            try:
+                return self._probe_repo_pygit2(cwd)
+            except Exception:
+                pass  # e.g. a repository format libgit2 can't read
+
+        # Both probes only need cwd (get-url works from any subdirectory),
+        # so start them together and let their fork/exec overlap.
+        try:
+            toplevel_proc = self._start_git(["rev-parse", "--show-toplevel"], cwd)
+            origin_proc = self._start_git(["remote", "get-url", "origin"], cwd)
+        except OSError:
+            return None
+
+        repo_root = self._finish_git(toplevel_proc)
+        origin_url = self._finish_git(origin_proc)
+        if repo_root is None or origin_url is None:
+            return None
+        return repo_root, origin_url
+
+    @staticmethod
+    def _probe_repo_pygit2(cwd: Path) -> tuple[str, str] | None:
+        """Resolve the repo root and origin URL with pygit2."""
+        if pygit2 is None:
+            raise ImportError("pygit2 package not installed")
+        git_dir = pygit2.discover_repository(str(cwd))
+        if git_dir is None:
+            return None
+        repo = pygit2.Repository(git_dir)
+        if repo.workdir is None:
+            return None  # bare repository
+        try:
+            origin = repo.remotes["origin"]
+        except KeyError:
+            return None
+        if not origin.url:
+            return None
+        return str(Path(repo.workdir)), origin.url
+
+    @staticmethod
+    def _start_git(args: list[str], cwd: Path) -> subprocess.Popen:
+        """Start a read-only git command without waiting for it."""
+        # Python creates fds non-inheritable, so skipping the close loop on
+        # Linux is safe and avoids its cost under a large RLIMIT_NOFILE.
+        return subprocess.Popen(
+            ["git", *args],
+            cwd=cwd,
+            env=_git_probe_env(),
+            close_fds=sys.platform != "linux",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    @staticmethod
+    def _finish_git(proc: subprocess.Popen) -> str | None:
+        """Wait for a git command; return stripped stdout, or None on failure."""
+        stdout, _ = proc.communicate()
+        if proc.returncode != 0:
+            return None
+        return stdout.strip()
+
     def _lookup_pipeline(
         self,
         hash_prefix: str,
@@ -338,41 +450,35 @@ class ReproductionService:
             if not artifact_hash:
                 return None
 
-            # Get producer job
-            jobs = ctx.artifacts.get_jobs(artifact["id"])
-            producers = jobs.get("produced_by", [])
-            if not producers:
+            # Get the producer job and its session in one query
+            producer, session = ctx.artifacts.get_producer_session(artifact["id"])
+            if not producer:
                 return None
 
-            producer = producers[0]
-
-            # Get session for the producer
             session_id = producer.get("session_id")
-            if not session_id:
+            if not session_id or not session:
                 return None
 
-            session = ctx.sessions.get(session_id)
-            if not session:
-                return None
-
-            # Get all steps from the session
-            steps = ctx.sessions.get_steps(session_id)
-
+            # The step dicts are fresh per call, so I/O is attached in place
+            # instead of copying each one.
             build_steps = []
             run_steps = []
-
-            for step in steps:
-                step_dict = dict(step)
-                # Add inputs/outputs
-                inputs = ctx.jobs.get_inputs(step["id"], ctx.artifacts)
-                outputs = ctx.jobs.get_outputs(step["id"], ctx.artifacts)
-                step_dict["_inputs"] = inputs
-                step_dict["_outputs"] = outputs
-
-                if step.get("job_type") == "build":
-                    build_steps.append(step_dict)
+            for step in ctx.sessions.get_steps(session_id):
+                job_type = step.get("job_type")
+                if job_type:
+                    step["job_type"] = job_type = sys.intern(job_type)
+                if job_type == "build":
+                    build_steps.append(step)
                 else:
-                    run_steps.append(step_dict)
+                    run_steps.append(step)
+
+            io_by_job = ctx.jobs.get_io_for_jobs(
+                (step["id"] for step in chain(build_steps, run_steps)), ctx.artifacts
+            )
+            for step in chain(build_steps, run_steps):
+                io = io_by_job[step["id"]]
+                step["_inputs"] = self._intern_paths(io["inputs"])
+                step["_outputs"] = self._intern_paths(io["outputs"])
 
             return PipelineInfo(
                 artifact_hash=artifact_hash,
@@ -383,6 +489,14 @@ class ReproductionService:
                 total_steps=len(build_steps) + len(run_steps),
             )
 
+    @staticmethod
+    def _intern_paths(entries: list[dict]) -> list[dict]:
+        """Intern I/O paths, which repeat across steps that share artifacts."""
+        for entry in entries:
+            if entry.get("path"):
+                entry["path"] = sys.intern(entry["path"])
+        return entries
+
     def _lookup_remote(
         self,
         hash_prefix: str,
@@ -399,15 +513,21 @@ class ReproductionService:
         if not client:
             return None, "No GLaaS server configured"
 
+        # Both requests depend only on the hash prefix, so issue them together
+        # instead of paying two round-trips back to back.
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="roar-glaas") as pool:
+            artifact_future = pool.submit(client.get_artifact, hash_prefix)
+            dag_future = pool.submit(client.get_artifact_dag, hash_prefix)
+
         # Get artifact info
-        artifact, artifact_error = client.get_artifact(hash_prefix)
+        artifact, artifact_error = artifact_future.result()
         if artifact_error:
             return None, artifact_error  # Propagate the actual error
         if not artifact:
             return None, None  # Not found, not an error
 
         # Get pipeline
-        pipeline_data, error = client.get_artifact_dag(hash_prefix)
+        pipeline_data, error = dag_future.result()
         if error:
             return None, error
         if not pipeline_data:
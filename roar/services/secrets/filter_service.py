@@ -4,13 +4,50 @@ Secret filter service.
 Wraps OmitFilter with the ISecretFilter protocol for use in registration services.
 """
 
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from ...config import config_get
 from ...core.interfaces.registration import ISecretFilter
+from ...core.settings import find_config_file
 from ...filters.omit import OmitFilter
 
 
+@lru_cache(maxsize=8)
+def _build_omit_filter(
+    config_key: str,
+    config_path: Path | None,
+    mtime_ns: int | None,
+    env: tuple[tuple[str, str], ...],
+) -> OmitFilter | None:
+    """
+    Build the OmitFilter for a config key, memoized per config version.
+
+    ``config_path``, ``mtime_ns`` and ``env`` are only part of the cache key,
+    so an edited or newly discovered config file, or a changed ``ROAR_*``
+    environment override, produces a fresh filter.
+    """
+    omit_config = config_get(config_key)
+    if omit_config:
+        return OmitFilter(omit_config)
+    return None
+
+
+def _config_version() -> tuple[Path | None, int | None, tuple[tuple[str, str], ...]]:
+    """Return the active config file, its modification time and env overrides."""
+    # load_settings() merges ROAR_<section>__<field> variables over the file
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("ROAR_")))
+    path = find_config_file()
+    if path is None:
+        return None, None, env
+    try:
+        return path.resolve(), path.stat().st_mtime_ns, env
+    except OSError:
+        return path, None, env
+
+
 class SecretFilterService(ISecretFilter):
     """
     Service for filtering secrets from registration data.
@@ -41,16 +78,17 @@ class SecretFilterService(ISecretFilter):
         omit_filter = OmitFilter(omit_config) if omit_config else None
         ```
 
+        The compiled OmitFilter is cached per config key, config file
+        version and ROAR_* environment overrides, so repeated calls do not
+        reload the config or recompile the secret patterns.
+
         Args:
             config_key: Configuration key for omit settings
 
         Returns:
             SecretFilterService with configured filter, or disabled filter if no config
         """
-        omit_config = config_get(config_key)
-        if omit_config:
-            return cls(OmitFilter(omit_config))
-        return cls(None)
+        return cls(_build_omit_filter(config_key, *_config_version()))
 
     @classmethod
     def from_dict(cls, config: dict[str, Any] | None) -> "SecretFilterService":
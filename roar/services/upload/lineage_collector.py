@@ -6,12 +6,16 @@ This service collects all lineage data (jobs, artifacts) needed
 for registering artifacts with GLaaS.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from sqlalchemy import text
 
 from ...core.interfaces.upload import LineageData
 from ...db.context import create_database_context
+from ...db.services.lineage import resolve_io
 
 
 def compute_io_signature(job: dict) -> str:
@@ -34,14 +38,6 @@ def compute_io_signature(job: dict) -> str:
     return f"{inputs}|{outputs}"
 
 
-def _get_blake3(item: dict) -> str | None:
-    """Extract blake3 hash from item's hashes list."""
-    for h in item.get("hashes", []):
-        if h.get("algorithm") == "blake3":
-            return h.get("digest")
-    return None
-
-
 class LineageCollector:
     """
     Service for collecting lineage data for artifact upload.
@@ -61,6 +57,9 @@ class LineageCollector:
         print(f"Jobs: {len(lineage.jobs)}, Artifacts: {len(lineage.artifacts)}")
     """
 
+    # Job count from which re-run deduplication is pushed down to SQL
+    SQL_DEDUP_THRESHOLD = 200
+
     def collect(
         self,
         artifact_hashes: list[str],
@@ -76,25 +75,24 @@ class LineageCollector:
         Returns:
             LineageData containing jobs and artifacts in the lineage
         """
-        with create_database_context(roar_dir) as ctx_db:
+        with (
+            create_database_context(roar_dir) as ctx_db,
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="roar-lineage") as pool,
+        ):
+            # The active pipeline's build jobs don't depend on the lineage
+            # walk, so load them on a second connection in the meantime.
+            pipeline_future = pool.submit(self._load_active_pipeline, ctx_db)
+
             # Get lineage jobs (with input/output hashes populated)
             lineage_jobs = ctx_db.lineage.get_lineage_jobs(artifact_hashes)
 
-            # Collect artifact hashes from the lineage sub-DAG
-            lineage_artifact_hashes = set(artifact_hashes)
-            for job in lineage_jobs:
-                lineage_artifact_hashes.update(job.get("_input_hashes", []))
-                lineage_artifact_hashes.update(job.get("_output_hashes", []))
-
-            # Include build jobs from the active pipeline (filtered to sub-DAG)
-            pipeline = ctx_db.sessions.get_active()
+            # Include build jobs from the active pipeline
+            pipeline, build_jobs = pipeline_future.result()
             if pipeline:
-                lineage_jobs = self._add_build_jobs(
-                    ctx_db, pipeline, lineage_jobs, lineage_artifact_hashes
-                )
+                lineage_jobs = self._merge_build_jobs(build_jobs, lineage_jobs)
 
             # Deduplicate re-runs
-            lineage_jobs = self._deduplicate_reruns(lineage_jobs)
+            lineage_jobs = self._deduplicate_reruns(lineage_jobs, ctx_db)
 
             # Collect all artifact hashes referenced by jobs (after deduplication)
             all_lineage_hashes = self._collect_all_hashes(lineage_jobs)
@@ -109,14 +107,27 @@ class LineageCollector:
             pipeline=pipeline,
         )
 
-    def _add_build_jobs(
-        self,
-        ctx_db,
-        pipeline: dict,
-        lineage_jobs: list[dict],
-        lineage_artifact_hashes: set[str],
-    ) -> list[dict]:
-        """Add build jobs from the active pipeline that are connected to the lineage."""
+    def _load_active_pipeline(self, ctx_db) -> tuple[dict | None, list[dict]]:
+        """
+        Load the active pipeline and its latest build jobs.
+
+        Runs on a worker thread, so it reads through a sibling context with
+        its own connection rather than the caller's session.
+        """
+        with ctx_db.sibling() as reader:
+            pipeline = reader.sessions.get_active()
+            if not pipeline:
+                return None, []
+            return pipeline, self._load_build_jobs(reader, pipeline)
+
+    @staticmethod
+    def _merge_build_jobs(build_jobs: list[dict], lineage_jobs: list[dict]) -> list[dict]:
+        """Prepend build jobs to the lineage jobs, avoiding duplicates."""
+        build_job_ids = {job["id"] for job in build_jobs}
+        return build_jobs + [j for j in lineage_jobs if j["id"] not in build_job_ids]
+
+    def _load_build_jobs(self, ctx_db, pipeline: dict) -> list[dict]:
+        """Load the latest build job per step of a pipeline, with I/O resolved."""
         build_jobs = ctx_db.conn.execute(
             text("""
                 SELECT j.* FROM jobs j
@@ -132,68 +143,63 @@ class LineageCollector:
         ).fetchall()
 
         # Include ALL build jobs from the session - they set up the environment
-        build_job_ids = set()
         build_job_list = []
 
-        for bj in build_jobs:
-            job_dict = dict(bj._mapping) if hasattr(bj, "_mapping") else dict(bj)
-            job_id = bj.id if hasattr(bj, "id") else bj["id"]
-            inputs = ctx_db.jobs.get_inputs(job_id, ctx_db.artifacts)
-            outputs = ctx_db.jobs.get_outputs(job_id, ctx_db.artifacts)
-
-            job_dict["_input_hashes"] = [h for h in (_get_blake3(inp) for inp in inputs) if h]
-            job_dict["_output_hashes"] = [h for h in (_get_blake3(out) for out in outputs) if h]
-
-            # Structured inputs/outputs with hash and path
-            job_dict["_inputs"] = [
-                {"hash": h, "path": inp.get("path") or inp.get("first_seen_path", "")}
-                for inp in inputs
-                if (h := _get_blake3(inp))
-            ]
-            job_dict["_outputs"] = [
-                {"hash": h, "path": out.get("path") or out.get("first_seen_path", "")}
-                for out in outputs
-                if (h := _get_blake3(out))
-            ]
-
-            build_job_ids.add(job_id)
+        # Fetch I/O for all build jobs at once rather than two queries per job
+        job_dicts = [
+            dict(bj._mapping) if hasattr(bj, "_mapping") else dict(bj) for bj in build_jobs
+        ]
+        io_by_job = ctx_db.jobs.get_io_for_jobs((jd["id"] for jd in job_dicts), ctx_db.artifacts)
+
+        for job_dict in job_dicts:
+            job_id = job_dict["id"]
+            inputs = io_by_job[job_id]["inputs"]
+            outputs = io_by_job[job_id]["outputs"]
+
+            # Hash-only and structured (hash + path) views of the same I/O
+            job_dict["_input_hashes"], job_dict["_inputs"] = resolve_io(inputs)
+            job_dict["_output_hashes"], job_dict["_outputs"] = resolve_io(outputs)
+
             build_job_list.append(job_dict)
 
-        # Combine build jobs with lineage jobs, avoiding duplicates
-        return build_job_list + [j for j in lineage_jobs if j["id"] not in build_job_ids]
+        return build_job_list
 
-    def _deduplicate_reruns(self, jobs: list[dict]) -> list[dict]:
+    def _deduplicate_reruns(self, jobs: list[dict], ctx_db=None) -> list[dict]:
         """
         Eliminate re-runs, keeping only the latest job per signature.
 
         A node X is a re-run of node Y if they have identical inputs and outputs.
+        Large job sets are deduplicated in SQL when a database context is given;
+        small ones are cheaper to handle in Python.
         """
-        seen_signatures: dict[str, dict] = {}
-
-        for job in jobs:
-            sig = compute_io_signature(job)
-            existing = seen_signatures.get(sig)
-            # Keep the later job (re-run supersedes earlier runs)
-            if existing is None or job["timestamp"] > existing["timestamp"]:
-                seen_signatures[sig] = job
+        if ctx_db is not None and len(jobs) >= self.SQL_DEDUP_THRESHOLD:
+            keep = ctx_db.jobs.get_latest_per_io_signature(j["id"] for j in jobs)
+            return sorted((j for j in jobs if j["id"] in keep), key=lambda j: j["timestamp"])
+
+        # Sort once by (signature, newest first); the head of each signature
+        # group is the re-run that supersedes the others. The sort is stable,
+        # so among equal timestamps the earliest listed job wins.
+        keyed = sorted(
+            ((compute_io_signature(job), job) for job in jobs),
+            key=lambda pair: (pair[0], -pair[1]["timestamp"]),
+        )
+        latest = [next(group)[1] for _, group in groupby(keyed, key=itemgetter(0))]
 
-        return sorted(seen_signatures.values(), key=lambda j: j["timestamp"])
+        return sorted(latest, key=lambda j: j["timestamp"])
 
     def _collect_all_hashes(self, jobs: list[dict]) -> set[str]:
         """Collect all artifact hashes referenced by jobs."""
-        all_hashes = set()
-        for job in jobs:
-            for h in job.get("_input_hashes", []):
-                all_hashes.add(h)
-            for h in job.get("_output_hashes", []):
-                all_hashes.add(h)
-        return all_hashes
+        return set().union(
+            *(job.get("_input_hashes", ()) for job in jobs),
+            *(job.get("_output_hashes", ()) for job in jobs),
+        )
 
     def _get_artifact_info(self, ctx_db, hashes: set[str]) -> list[dict]:
         """Get artifact info for all lineage hashes."""
+        found = ctx_db.artifacts.get_many_by_hash(hashes, algorithm="blake3")
         artifacts = []
         for h in hashes:
-            artifact = ctx_db.artifacts.get_by_hash(h, algorithm="blake3")
+            artifact = found.get(h.lower())
             if artifact:
                 artifact["hash"] = h  # Add the hash we looked up
                 artifacts.append(artifact)
@@ -4,10 +4,13 @@ Upload service for orchestrating artifact upload and registration.
 Extracted from put.py to follow Single Responsibility Principle.
 """
 
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ...core.interfaces.upload import UploadResult
+from ..registration.artifact import batch_by_size
 from ..vcs import GitAccessService
 from .lineage_collector import LineageCollector
 
@@ -16,6 +19,24 @@ if TYPE_CHECKING:
     from ...core.interfaces.presenter import IPresenter
     from ...glaas_client import GlaasClient
 
+# GLaaS client errors for HTTP failures read "HTTP <status>: <detail>"
+_HTTP_STATUS_RE = re.compile(r"^HTTP (\d{3})\b")
+
+# Batch failures that would fail identically for every single artifact
+_AUTH_STATUSES = frozenset({401, 403})
+
+
+def _batch_error_is_retryable(error: str) -> bool:
+    """
+    Return True if registering the batch one artifact at a time may succeed.
+
+    Any HTTP failure other than an auth rejection qualifies: a missing batch
+    endpoint, an oversized body, a 5xx, or a 400/422 caused by one bad
+    artifact in the batch. Connection and configuration errors do not.
+    """
+    match = _HTTP_STATUS_RE.match(error)
+    return match is not None and int(match.group(1)) not in _AUTH_STATUSES
+
 
 class UploadService:
     """
@@ -40,11 +61,17 @@ class UploadService:
         )
     """
 
+    # File count from which the destination prefix is listed once instead
+    # of checking each file with exists()
+    PREFETCH_THRESHOLD = 20
+
     def __init__(
         self,
         glaas_client: "GlaasClient | None" = None,
         cloud_provider: "ICloudStorageProvider | None" = None,
         presenter: "IPresenter | None" = None,
+        max_workers: int = 8,
+        register_workers: int = 8,
     ):
         """
         Initialize upload service with dependencies.
@@ -53,20 +80,22 @@ class UploadService:
             glaas_client: GLaaS API client
             cloud_provider: Cloud storage provider for uploads
             presenter: Presenter for user feedback
+            max_workers: Maximum number of files uploaded concurrently
+            register_workers: Maximum number of concurrent GLaaS artifact
+                registration requests
         """
         self._glaas = glaas_client
         self._cloud = cloud_provider
         self._presenter = presenter
+        self._max_workers = max(1, max_workers)
+        self._register_workers = max(1, register_workers)
         self._lineage_collector = LineageCollector()
         self._git_access = GitAccessService()
 
-    def _get_source_type(self, url: str | None) -> str:
+    @staticmethod
+    def _get_source_type(url: str | None) -> str:
         """Determine source type from destination URL."""
-        if not url:
-            return "output"
-        if url.startswith("http"):
-            return "https"
-        return "output"
+        return "https" if url and url.startswith("http") else "output"
 
     def upload_and_register(
         self,
@@ -126,25 +155,38 @@ class UploadService:
                 warnings.append(f"Git push access warning: {access.error}")
                 # Don't fail, just warn and skip tagging
 
-        # Upload files to cloud storage (if cloud provider available)
-        uploaded_count = 0
+        # Get hashes from local database (regardless of cloud upload)
+        uploaded_hashes = self._get_local_hashes(resolved_sources, roar_dir)
 
+        # Upload files to cloud storage (if cloud provider available)
         if self._cloud:
-            for src in resolved_sources:
-                ok, error = self._upload_file(src, dest_url, force)
-                if ok:
-                    uploaded_count += 1
-                else:
+            # Lineage only reads the local database, so collect it on a
+            # background thread while the files upload.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="roar-lineage") as pool:
+                lineage_future = (
+                    pool.submit(self._lineage_collector.collect, uploaded_hashes, roar_dir)
+                    if uploaded_hashes
+                    else None
+                )
+                existing = (
+                    self._prefetch_existing(dest_url)
+                    if not force and len(resolved_sources) >= self.PREFETCH_THRESHOLD
+                    else None
+                )
+                uploaded_count, failure = self._upload_files(
+                    resolved_sources, dest_url, force, existing_keys=existing
+                )
+                if failure:
+                    src, error = failure
                     return UploadResult(
                         success=False,
                         error=f"Upload failed for {src}: {error}",
                         warnings=warnings,
                     )
-
-        # Get hashes from local database (regardless of cloud upload)
-        uploaded_hashes = self._get_local_hashes(resolved_sources, roar_dir)
-        if not self._cloud:
+                lineage = lineage_future.result() if lineage_future else None
+        else:
             uploaded_count = len(uploaded_hashes)
+            lineage = None
 
         # Collect lineage data
         if not uploaded_hashes:
@@ -154,31 +196,22 @@ class UploadService:
                 warnings=warnings,
             )
 
-        lineage = self._lineage_collector.collect(uploaded_hashes, roar_dir)
+        if lineage is None:
+            lineage = self._lineage_collector.collect(uploaded_hashes, roar_dir)
 
         # Get session hash for artifact registration
         session_hash = lineage.pipeline.get("hash") if lineage.pipeline else None
 
         # Register with GLaaS
         registered_count = 0
-        if self._glaas:
-            source_type = self._get_source_type(dest_url)
-            for artifact in lineage.artifacts:
-                if not session_hash:
-                    continue  # Can't register without session
-                artifact_size = artifact.get("size")
-                if artifact_size is None:
-                    continue  # Skip artifacts without size
-                ok, _err = self._glaas.register_artifact(
-                    hashes=artifact.get("hashes", []),
-                    size=int(artifact_size),
-                    source_type=source_type,
-                    session_hash=session_hash,
-                    source_url=dest_url if dest_url else None,
-                )
-                if ok:
-                    registered_count += 1
-
+        if self._glaas and session_hash:  # Can't register without session
+            registered_count = self._register_artifacts(
+                lineage.artifacts,
+                self._get_source_type(dest_url),
+                session_hash,
+                dest_url,
+                warnings,
+            )
             # Note: Jobs are registered via register_job separately, not here
 
         return UploadResult(
@@ -189,15 +222,156 @@ class UploadService:
             warnings=warnings,
         )
 
+    def _register_artifacts(
+        self,
+        artifacts: list[dict],
+        source_type: str,
+        session_hash: str,
+        dest_url: str | None,
+        warnings: list[str],
+    ) -> int:
+        """
+        Register lineage artifacts with GLaaS.
+
+        Artifacts are sent through the batch endpoint in size-bounded
+        batches. If a batch request fails in a way single requests can get
+        past (see _batch_error_is_retryable), that batch and the rest are
+        registered one request per artifact, up to register_workers at a
+        time. Any other failure stops registration. Artifacts the server
+        rejects, and those left unregistered, are reported in warnings.
+        Artifacts without a size are skipped.
+
+        Returns:
+            Number of artifacts registered successfully
+        """
+        if not self._glaas:
+            return 0
+
+        # Fields shared by every payload are built once and copied per artifact
+        common: dict = {"source_type": source_type, "session_hash": session_hash}
+        if dest_url:
+            common["source_url"] = dest_url
+
+        payloads = []
+        for artifact in artifacts:
+            size = artifact.get("size")
+            if size is None:
+                continue
+            payloads.append({"hashes": artifact.get("hashes", []), "size": int(size), **common})
+
+        registered = 0
+        rejected = 0
+        batches = batch_by_size(payloads)
+        for i, batch in enumerate(batches):
+            success_count, error_count, error = self._glaas.register_artifacts_batch(batch)
+            if error:
+                remaining = [payload for rest in batches[i:] for payload in rest]
+                if not _batch_error_is_retryable(error):
+                    warnings.append(
+                        f"Artifact registration stopped: {error} "
+                        f"({len(remaining)} of {len(payloads)} artifacts not registered)"
+                    )
+                    return registered
+                individual = self._register_artifacts_individually(remaining)
+                if individual < len(remaining):
+                    warnings.append(
+                        f"Batch artifact registration failed ({error}); "
+                        f"{len(remaining) - individual} of {len(remaining)} artifacts "
+                        "also failed individually"
+                    )
+                return registered + individual
+            registered += success_count
+            rejected += error_count
+        if rejected:
+            warnings.append(f"GLaaS rejected {rejected} of {len(payloads)} artifacts")
+        return registered
+
+    def _register_artifacts_individually(self, payloads: list[dict]) -> int:
+        """Register artifact payloads one request each, up to register_workers at a time."""
+        if not self._glaas or not payloads:
+            return 0
+
+        glaas = self._glaas
+
+        def _register(payload: dict) -> bool:
+            ok, _err = glaas.register_artifact(**payload)
+            return ok
+
+        workers = min(self._register_workers, len(payloads))
+        if workers <= 1:
+            return sum(1 for payload in payloads if _register(payload))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="roar-register") as pool:
+            return sum(1 for ok in pool.map(_register, payloads) if ok)
+
+    def _upload_files(
+        self,
+        sources: list[Path],
+        dest_url: str,
+        force: bool,
+        existing_keys: set[str] | None = None,
+    ) -> tuple[int, tuple[Path, str | None] | None]:
+        """
+        Upload files to cloud storage, up to max_workers at a time.
+
+        Stops scheduling further uploads after the first failure; uploads
+        already in flight are allowed to finish. existing_keys is passed
+        through to _upload_file. Per-file progress bars are only shown when
+        uploading one file at a time, since concurrent bars would interleave.
+
+        Returns:
+            Tuple of (uploaded_count, failure) where failure is
+            (source, error_message) for the first failed upload, or None.
+        """
+        workers = min(self._max_workers, len(sources))
+        if workers <= 1:
+            for count, src in enumerate(sources):
+                ok, error = self._upload_file(src, dest_url, force, existing_keys)
+                if not ok:
+                    return count, (src, error)
+            return len(sources), None
+
+        uploaded_count = 0
+        failure: tuple[Path, str | None] | None = None
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="roar-upload") as pool:
+            pending = {
+                pool.submit(
+                    self._upload_file, src, dest_url, force, existing_keys, show_progress=False
+                ): src
+                for src in sources
+            }
+            while pending and failure is None:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    src = pending.pop(future)
+                    ok, error = future.result()
+                    if ok:
+                        uploaded_count += 1
+                    elif failure is None:
+                        failure = (src, error)
+                if failure is not None:
+                    for future in pending:
+                        future.cancel()
+        return uploaded_count, failure
+
     def _upload_file(
         self,
         source: Path,
         dest_url: str,
         force: bool,
+        existing_keys: set[str] | None = None,
+        show_progress: bool = True,
     ) -> tuple[bool, str | None]:
         """
         Upload a single file to cloud storage.
 
+        Args:
+            source: Local file to upload
+            dest_url: Destination cloud URL prefix
+            force: Upload even if the destination already exists
+            existing_keys: Destination URLs known to exist (from
+                _prefetch_existing); when None, existence is checked per file
+            show_progress: Whether the cloud provider shows a progress bar
+
         Returns:
             Tuple of (success, hash_or_error)
             - On success: (True, None) - hash will be looked up from DB separately
@@ -207,13 +381,17 @@ class UploadService:
             return False, "No cloud provider configured"
 
         try:
-            # Check if already exists (unless force)
             dest_path = f"{dest_url.rstrip('/')}/{source.name}"
-            if not force and hasattr(self._cloud, "exists") and self._cloud.exists(dest_path):
-                return True, None  # Already exists
+            # Check if already exists (unless force)
+            if not force:
+                if existing_keys is not None:
+                    if dest_path in existing_keys:
+                        return True, None  # Already exists
+                elif self._cloud.exists(dest_path):
+                    return True, None  # Already exists
 
             # Upload - interface returns tuple[bool, str] (success, error_message)
-            success, error = self._cloud.upload(str(source), dest_path)
+            success, error = self._cloud.upload(str(source), dest_path, show_progress=show_progress)
             if success:
                 return True, None
             else:
@@ -225,6 +403,42 @@ class UploadService:
         except Exception as e:
             return False, str(e)
 
+    def _prefetch_existing(self, dest_url: str) -> set[str] | None:
+        """
+        List the destination prefix once to learn which uploads already exist.
+
+        Returns:
+            Set of destination URLs (dest_url/name) directly under dest_url,
+            or None if the listing is unavailable and existence must be
+            checked per file.
+        """
+        if not self._cloud:
+            return None
+
+        try:
+            ok, objects, _error = self._cloud.list_objects(dest_url)
+            _bucket, prefix = self._cloud.parse_url(dest_url)
+        except Exception:
+            return None
+        if not ok:
+            return None
+
+        base = dest_url.rstrip("/")
+        prefix = prefix.strip("/")
+        existing = set()
+        for obj in objects:
+            # Providers may list full URLs, bucket keys, or bare names
+            if "://" in obj:
+                if obj.rstrip("/").rsplit("/", 1)[0] == base:
+                    existing.add(obj)
+                continue
+            name = obj.strip("/")
+            if prefix and name.startswith(f"{prefix}/"):
+                name = name[len(prefix) + 1 :]
+            if name and "/" not in name:
+                existing.add(f"{base}/{name}")
+        return existing
+
     def _get_local_hashes(
         self,
         sources: list[Path],
@@ -235,21 +449,29 @@ class UploadService:
 
         hashes = []
         with create_database_context(roar_dir) as ctx:
-            for src in sources:
-                # Look up artifact by path in outputs
-                artifact = self._find_artifact_by_path(ctx, str(src))
-                if artifact:
-                    for h in artifact.get("hashes", []):
-                        if h.get("algorithm") == "blake3":
-                            hashes.append(h.get("digest"))
-                            break
+            by_path = self._index_outputs_by_path(ctx)
+        for src in sources:
+            # Look up artifact by path in outputs
+            output = by_path.get(str(src))
+            if output:
+                digest = next(
+                    (
+                        h.get("digest")
+                        for h in output.get("hashes", ())
+                        if h.get("algorithm") == "blake3"
+                    ),
+                    None,
+                )
+                if digest:
+                    hashes.append(digest)
         return hashes
 
-    def _find_artifact_by_path(self, ctx, path: str) -> dict | None:
-        """Find artifact by output path."""
-        # Check recent outputs
-        outputs = ctx.artifacts.get_all_outputs_with_paths()
-        for out in outputs:
-            if out.get("path") == path:
-                return ctx.artifacts.get(out["artifact_id"])
-        return None
+    def _index_outputs_by_path(self, ctx) -> dict[str, dict]:
+        """Map each output path to its most recent output (with hashes)."""
+        by_path: dict[str, dict] = {}
+        # Outputs come newest first; keep the first artifact seen per path
+        for out in ctx.artifacts.get_all_outputs_with_paths():
+            path = out.get("path")
+            if path is not None:
+                by_path.setdefault(path, out)
+        return by_path
@@ -4,9 +4,19 @@ Git access service for checking push permissions.
 Extracted from put.py to follow Single Responsibility Principle.
 """
 
-import re
 import subprocess
+import time
 from dataclasses import dataclass
+from typing import Any
+
+from ...utils.git_url import ssh_host
+
+try:
+    import pygit2 as _pygit2
+
+    pygit2: Any | None = _pygit2
+except ImportError:
+    pygit2 = None
 
 
 @dataclass
@@ -31,6 +41,17 @@ class GitAccessService:
             print(f"No access: {result.error}")
     """
 
+    def __init__(self, cache_ttl: float = 60.0):
+        """
+        Initialize the service.
+
+        Args:
+            cache_ttl: Seconds a push access result is reused for the same
+                (git_url, repo_root); 0 disables caching
+        """
+        self._cache_ttl = cache_ttl
+        self._access_cache: dict[tuple[str, str | None], tuple[float, AccessCheckResult]] = {}
+
     def check_push_access(
         self,
         git_url: str,
@@ -45,6 +66,9 @@ class GitAccessService:
         2. SSH connectivity test for SSH URLs
         3. Assumes access for HTTPS URLs (can't easily test)
 
+        Results are reused for the same (git_url, repo_root) for cache_ttl
+        seconds, so repeated checks in one run don't re-spawn git/ssh.
+
         Args:
             git_url: Git remote URL (SSH or HTTPS)
             repo_root: Local repository root path
@@ -56,6 +80,23 @@ class GitAccessService:
         if not git_url:
             return AccessCheckResult(has_access=False, error="No git URL")
 
+        key = (git_url, repo_root)
+        cached = self._access_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        result = self._check_push_access(git_url, repo_root, timeout)
+        if self._cache_ttl > 0:
+            self._access_cache[key] = (time.monotonic(), result)
+        return result
+
+    def _check_push_access(
+        self,
+        git_url: str,
+        repo_root: str | None,
+        timeout: int,
+    ) -> AccessCheckResult:
+        """Run the push access checks without consulting the cache."""
         # Try git push --dry-run if we have repo root
         if repo_root:
             result = self._try_dry_run_push(repo_root, timeout)
@@ -89,14 +130,15 @@ class GitAccessService:
                 ["git", "push", "--dry-run", "origin", "HEAD"],
                 cwd=repo_root,
                 capture_output=True,
-                text=True,
                 timeout=timeout,
             )
 
             if result.returncode == 0:
                 return AccessCheckResult(has_access=True)
 
-            stderr = result.stderr.lower()
+            # Only decode output when there is an error to report
+            error_text = result.stderr.decode(errors="replace")
+            stderr = error_text.lower()
             if "permission denied" in stderr:
                 return AccessCheckResult(
                     has_access=False,
@@ -113,7 +155,7 @@ class GitAccessService:
                     error="Authentication failed",
                 )
 
-            return AccessCheckResult(has_access=False, error=result.stderr.strip())
+            return AccessCheckResult(has_access=False, error=error_text.strip())
 
         except subprocess.TimeoutExpired:
             return AccessCheckResult(
@@ -134,11 +176,10 @@ class GitAccessService:
 
         Returns None if URL is not SSH format.
         """
-        ssh_match = re.match(r"^(?:ssh://)?git@([^:/]+)[:/]", git_url)
-        if not ssh_match:
+        host = ssh_host(git_url)
+        if host is None:
             return None
 
-        host = ssh_match.group(1)
         try:
             result = subprocess.run(
                 [
@@ -180,23 +221,32 @@ class GitAccessService:
         """
         Check if the current branch is pushed to remote.
 
+        Inspects the repository in-process when pygit2 is installed,
+        otherwise (or if libgit2 cannot read it) shells out to git.
+
         Args:
             repo_root: Local repository root path
 
         Returns:
             Tuple of (is_pushed, error_message)
         """
+        if pygit2 is not None:
+            try:
+                return self._check_branch_pushed_pygit2(repo_root)
+            except Exception:
+                pass  # e.g. unborn HEAD or a repository libgit2 can't read
+
         try:
             result = subprocess.run(
                 ["git", "branch", "-r", "--contains", "HEAD"],
                 cwd=repo_root,
                 capture_output=True,
-                text=True,
             )
 
             if result.returncode != 0:
                 return False, "Could not check branch status"
 
+            # Only emptiness matters, so the branch list is never decoded
             if not result.stdout.strip():
                 return False, "Current commit hasn't been pushed to remote"
 
@@ -204,3 +254,16 @@ class GitAccessService:
 
         except Exception as e:
             return False, str(e)
+
+    @staticmethod
+    def _check_branch_pushed_pygit2(repo_root: str) -> tuple[bool, str | None]:
+        """Check whether any remote-tracking branch contains HEAD using pygit2."""
+        if pygit2 is None:
+            raise ImportError("pygit2 package not installed")
+        repo = pygit2.Repository(repo_root)
+        head = repo.head.target
+        for name in repo.branches.remote:
+            target = repo.branches.remote[name].resolve().target
+            if target == head or repo.descendant_of(target, head):
+                return True, None
+        return False, "Current commit hasn't been pushed to remote"
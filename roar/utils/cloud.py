@@ -5,6 +5,7 @@ Pure utility functions for cloud URL parsing and CLI availability checking.
 These functions have no provider dependencies and can be used independently.
 """
 
+from functools import lru_cache
 from urllib.parse import urlparse
 
 
@@ -38,13 +39,16 @@ def is_directory_url(url: str) -> bool:
     Returns:
         True if URL represents a directory
     """
-    return url.rstrip("/") != url or not urlparse(url).path.split("/")[-1]
+    return url.endswith("/") or not urlparse(url).path.split("/")[-1]
 
 
+@lru_cache(maxsize=32)
 def check_cli_available(scheme: str) -> tuple[bool, str]:
     """
     Check if the required CLI tool is available for a cloud scheme.
 
+    Cached per scheme so per-file callers don't repeat the lookup.
+
     Args:
         scheme: Cloud scheme
 
@@ -54,6 +58,7 @@ def check_cli_available(scheme: str) -> tuple[bool, str]:
     return False, f"unknown-{scheme}"
 
 
+@lru_cache(maxsize=32)
 def get_cli_install_hint(scheme: str) -> str:
     """
     Get installation hint for a cloud CLI tool.
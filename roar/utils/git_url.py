@@ -6,8 +6,19 @@ and normalizing URLs for comparison across protocols.
 """
 
 import re
+from functools import lru_cache
 
+# SCP format: git@host:path
+_SCP_RE = re.compile(r"^git@([^:/]+):(.+)$")
+# SSH scheme: ssh://git@host/path
+_SSH_RE = re.compile(r"^ssh://git@([^/]+)/(.+)$")
+# HTTPS/HTTP: https://host/path
+_HTTPS_RE = re.compile(r"^https?://([^/]+)/(.+)$")
+# Either SSH form, capturing the host
+_SSH_ANY_RE = re.compile(r"^(?:ssh://)?git@([^:/]+)[:/]")
 
+
+@lru_cache(maxsize=256)
 def normalize_git_url(url: str) -> str:
     """
     Normalize a git URL to a canonical form for comparison.
@@ -27,19 +38,19 @@ def normalize_git_url(url: str) -> str:
         Normalized URL string (host/path without protocol or .git suffix)
     """
     # SCP format: git@host:path
-    scp_match = re.match(r"^git@([^:/]+):(.+)$", url)
+    scp_match = _SCP_RE.match(url)
     if scp_match:
         host, path = scp_match.group(1), scp_match.group(2)
         return f"{host}/{path.removesuffix('.git')}"
 
     # SSH scheme: ssh://git@host/path
-    ssh_match = re.match(r"^ssh://git@([^/]+)/(.+)$", url)
+    ssh_match = _SSH_RE.match(url)
     if ssh_match:
         host, path = ssh_match.group(1), ssh_match.group(2)
         return f"{host}/{path.removesuffix('.git')}"
 
     # HTTPS/HTTP: https://host/path
-    https_match = re.match(r"^https?://([^/]+)/(.+)$", url)
+    https_match = _HTTPS_RE.match(url)
     if https_match:
         host, path = https_match.group(1), https_match.group(2)
         return f"{host}/{path.removesuffix('.git')}"
@@ -76,7 +87,28 @@ def is_ssh_url(url: str) -> bool:
     Returns:
         True if URL is SSH format, False otherwise
     """
-    return bool(re.match(r"^(?:ssh://)?git@([^:/]+)[:/]", url))
+    return ssh_host(url) is not None
+
+
+def ssh_host(url: str) -> str | None:
+    """
+    Extract the host from an SSH git URL.
+
+    Examples:
+        git@github.com:user/repo.git        -> github.com
+        ssh://git@github.com/user/repo.git  -> github.com
+
+    Args:
+        url: Git repository URL
+
+    Returns:
+        Host name, or None if the URL is not SSH format
+    """
+    # Cheap prefix test first: most URLs are HTTPS and never reach the regex
+    if not url.startswith(("git@", "ssh://")):
+        return None
+    match = _SSH_ANY_RE.match(url)
+    return match.group(1) if match else None
 
 
 def ssh_to_https(ssh_url: str) -> str | None:
@@ -94,12 +126,12 @@ def ssh_to_https(ssh_url: str) -> str | None:
         HTTPS URL if conversion successful, None if not an SSH URL
     """
     # SCP format: git@host:path
-    scp_match = re.match(r"^git@([^:/]+):(.+)$", ssh_url)
+    scp_match = _SCP_RE.match(ssh_url)
     if scp_match:
         return f"https://{scp_match.group(1)}/{scp_match.group(2)}"
 
     # SSH scheme: ssh://git@host/path
-    ssh_match = re.match(r"^ssh://git@([^/]+)/(.+)$", ssh_url)
+    ssh_match = _SSH_RE.match(ssh_url)
     if ssh_match:
         return f"https://{ssh_match.group(1)}/{ssh_match.group(2)}"
 
@@ -3,17 +3,31 @@ Shared pytest fixtures for roar tests.
 
 This module provides fixtures for integration testing the roar CLI:
 - temp_git_repo: Creates an isolated git repository with roar initialized
-- roar_cli: Helper to run roar CLI commands via subprocess
+  (copied from a session-scoped template)
+- roar_cli: Helper to run roar CLI commands (in-process for read-only
+  commands, via subprocess for commands that trace processes)
 - git_commit: Helper to commit changes between steps
 """
 
+import contextlib
+import os
+import shutil
 import subprocess
 import sys
-from collections.abc import Callable
+import traceback
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+try:
+    import pygit2 as _pygit2
+
+    pygit2: Any | None = _pygit2
+except ImportError:
+    pygit2 = None
+
 
 def _run_roar_cmd(*args: str, cwd: Path, check: bool = True) -> subprocess.CompletedProcess:
     """Run a roar command using the current Python interpreter."""
@@ -33,71 +47,165 @@ def _run_roar_cmd(*args: str, cwd: Path, check: bool = True) -> subprocess.Compl
     return result
 
 
-@pytest.fixture
-def temp_git_repo(tmp_path: Path) -> Path:
-    """
-    Create a temporary git repository with roar initialized.
+# Read-only or setup commands that are safe to run inside the test process.
+# `run`, `build` and `reproduce` trace child processes and install signal
+# handlers, so they keep going through a real subprocess.
+_INPROC_COMMANDS = frozenset({"init", "dag", "lineage", "log", "show", "status"})
 
-    Sets up:
-    - Empty git repository with initial commit
-    - .roar directory via `roar init`
-    - .gitignore with .roar/ entry
+# Set ROAR_TEST_SUBPROCESS=1 to run every command in its own process, e.g.
+# to rule out state leaking between in-process invocations
+_FORCE_SUBPROCESS = os.environ.get("ROAR_TEST_SUBPROCESS") == "1"
 
-    Returns:
-        Path to the temporary repository root
+
+@contextlib.contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    """Temporarily change the working directory."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _run_roar_inproc(*args: str, cwd: Path, check: bool = True) -> subprocess.CompletedProcess:
     """
-    # Initialize git repo
-    subprocess.run(
-        ["git", "init"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
-    )
+    Run a roar command in the test process via Click's test runner.
 
-    # Configure git user for commits
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
+    Avoids starting a new interpreter and re-importing roar for every call.
+    Returns a CompletedProcess so callers can't tell it from _run_roar_cmd.
+    """
+    from click.testing import CliRunner
+
+    from roar.cli import cli
+
+    try:
+        runner = CliRunner(mix_stderr=False)  # click < 8.2 mixes streams by default
+    except TypeError:
+        runner = CliRunner()  # click >= 8.2 always keeps stderr separate
+
+    with _chdir(cwd):
+        result = runner.invoke(cli, list(args))
+
+    stderr = result.stderr
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        stderr += "".join(traceback.format_exception(*result.exc_info))
+    completed = subprocess.CompletedProcess(
+        ["roar", *args], result.exit_code, result.stdout, stderr
     )
+    if check and completed.returncode != 0:
+        raise subprocess.CalledProcessError(
+            completed.returncode, completed.args, completed.stdout, completed.stderr
+        )
+    return completed
+
+
+def _run_roar(*args: str, cwd: Path, check: bool = True) -> subprocess.CompletedProcess:
+    """Run a roar command in-process when safe, otherwise in a subprocess."""
+    if not _FORCE_SUBPROCESS and args and args[0] in _INPROC_COMMANDS:
+        return _run_roar_inproc(*args, cwd=cwd, check=check)
+    return _run_roar_cmd(*args, cwd=cwd, check=check)
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hard-link git object files, which are immutable; copy everything else."""
+    if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            pass  # Content-addressed, so the existing object is identical
+        except OSError:
+            return shutil.copy2(src, dst)
+        return dst
+    return shutil.copy2(src, dst)
+
+
+def _copy_repo(src: Path, dst: Path) -> None:
+    """Copy a template repository into dst, sharing its git objects."""
+    shutil.copytree(src, dst, symlinks=True, copy_function=_link_or_copy, dirs_exist_ok=True)
+
+
+@pytest.fixture(scope="session")
+def _base_git_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Build the git repository with roar initialized once per test session.
+
+    temp_git_repo copies this template instead of re-running git and
+    `roar init` for every test. Nothing in it depends on its location.
+
+    Returns:
+        Path to the template repository root (never modified by tests)
+    """
+    base = tmp_path_factory.mktemp("base_git_repo")
 
     # Create .gitignore
-    gitignore = tmp_path / ".gitignore"
+    gitignore = base / ".gitignore"
     gitignore.write_text(".roar/\n")
 
-    # Initial commit
-    subprocess.run(
-        ["git", "add", ".gitignore"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
-    )
+    # Initialize git repo, configure the commit identity and make the
+    # initial commit in one shell rather than one spawn per git command.
+    # The repos are throwaway, so skip fsync, auto-gc, reflogs, signing and
+    # hooks (and the sample hooks an init template would add, which every
+    # test would otherwise copy); the config travels with every copy
     subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=tmp_path,
+        [
+            "sh",
+            "-c",
+            "git init -q --template="
+            " && git config user.email test@example.com"
+            " && git config user.name 'Test User'"
+            " && git config core.fsync none"
+            " && git config gc.auto 0"
+            " && git config core.autocrlf false"
+            " && git config core.logAllRefUpdates false"
+            " && git config commit.gpgsign false"
+            " && git config core.hooksPath /dev/null"
+            " && git add .gitignore"
+            " && git commit -q -m 'Initial commit'",
+        ],
+        cwd=base,
         capture_output=True,
         check=True,
     )
 
     # Initialize roar (use -y to auto-accept gitignore)
-    _run_roar_cmd("init", "-y", cwd=tmp_path)
+    _run_roar("init", "-y", cwd=base)
 
     # Disable ignore_tmp_files since tests run in /tmp directories
-    config_path = tmp_path / ".roar" / "config.toml"
+    config_path = base / ".roar" / "config.toml"
     config_content = config_path.read_text()
     config_content = config_content.replace("ignore_tmp_files = true", "ignore_tmp_files = false")
     config_path.write_text(config_content)
 
+    return base
+
+
+@pytest.fixture
+def temp_git_repo(tmp_path: Path, _base_git_repo: Path) -> Path:
+    """
+    Create a temporary git repository with roar initialized.
+
+    Sets up (by copying the session's template repository):
+    - Empty git repository with initial commit
+    - .roar directory via `roar init`
+    - .gitignore with .roar/ entry
+
+    Returns:
+        Path to the temporary repository root
+    """
+    # A fresh copy per test rather than one shared repo reset between tests:
+    # `git reset --hard` + `git clean -fdx` would not undo commits a test made
+    # and would wipe the ignored .roar/ directory along with its database
+    _copy_repo(_base_git_repo, tmp_path)
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def _repo_copier() -> Callable[[Path, Path], None]:
+    """Provide the template copy used by temp_git_repo to other conftests."""
+    return _copy_repo
+
+
 @pytest.fixture
 def roar_cli(temp_git_repo: Path) -> Callable[..., subprocess.CompletedProcess]:
     """
@@ -121,11 +229,26 @@ def roar_cli(temp_git_repo: Path) -> Callable[..., subprocess.CompletedProcess]:
         Returns:
             CompletedProcess with stdout/stderr as strings
         """
-        return _run_roar_cmd(*args, cwd=temp_git_repo, check=check)
+        return _run_roar(*args, cwd=temp_git_repo, check=check)
 
     return run_roar
 
 
+def _commit_all_pygit2(repo_path: Path, message: str) -> None:
+    """Stage everything like `git add -A` and commit, without spawning git."""
+    repo = pygit2.Repository(str(repo_path))
+    index = repo.index
+    index.add_all()
+    # add_all() leaves entries for deleted files in place; `git add -A` drops them
+    for entry in list(index):
+        if not os.path.lexists(repo_path / entry.path):
+            index.remove(entry.path)
+    index.write()
+    signature = repo.default_signature
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    repo.create_commit("HEAD", signature, signature, message, index.write_tree(), parents)
+
+
 @pytest.fixture
 def git_commit(temp_git_repo: Path) -> Callable[[str], None]:
     """
@@ -145,17 +268,24 @@ def git_commit(temp_git_repo: Path) -> Callable[[str], None]:
         """
         Stage and commit all changes.
 
+        Commits in-process when pygit2 is installed, otherwise through the
+        git CLI.
+
         Args:
             message: Commit message
         """
+        if pygit2 is not None:
+            _commit_all_pygit2(temp_git_repo, message)
+            return
         subprocess.run(
             ["git", "add", "-A"],
             cwd=temp_git_repo,
             capture_output=True,
             check=True,
         )
+        # No hooks, signing or summary output: the repo is a throwaway
         subprocess.run(
-            ["git", "commit", "-m", message, "--allow-empty"],
+            ["git", "commit", "-q", "--no-verify", "--no-gpg-sign", "--allow-empty", "-m", message],
             cwd=temp_git_repo,
             capture_output=True,
             check=True,
@@ -4,14 +4,32 @@ Happy path test fixtures.
 Provides reusable sample scripts and data for testing roar run scenarios.
 """
 
+import gc
+import subprocess
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="session")
+def _gc_freeze() -> Iterator[None]:
+    """
+    Keep objects alive for the whole session out of garbage collection.
+
+    Modules and session fixtures are moved to the permanent generation, so
+    collections during the tests only scan what the tests allocate. Cyclic
+    garbage from the tests (e.g. in-process CLI runs) is still collected.
+    """
+    gc.collect()
+    gc.freeze()
+    yield
+    gc.unfreeze()
+
+
+@pytest.fixture(scope="session")
 def python_exe() -> str:
     """
     Return the absolute path to the Python executable.
@@ -22,80 +40,64 @@ def python_exe() -> str:
     return sys.executable
 
 
-@pytest.fixture
-def sample_scripts(temp_git_repo: Path, git_commit: Callable) -> dict[str, Path]:
-    """
-    Create reusable sample Python scripts.
-
-    Creates scripts for:
-    - preprocess: Reads input.csv, writes processed.csv
-    - train: Reads processed.csv, writes model.pkl
-    - evaluate: Reads model.pkl and test.csv, writes metrics.json
-    - combine: Reads multiple inputs, writes combined output
-    - extract_*: Feature extraction scripts for fan-out patterns
-
-    Returns:
-        Dictionary mapping script name to Path
-    """
-    scripts = {}
-
-    # Preprocess script
-    preprocess = temp_git_repo / "preprocess.py"
-    preprocess.write_text("""
+# Sample script sources, keyed by fixture name: (filename, source)
+_SCRIPT_SOURCES: dict[str, tuple[str, str]] = {
+    "preprocess": (
+        "preprocess.py",
+        """
 import sys
 
 # Read input
 input_file = sys.argv[1] if len(sys.argv) > 1 else "input.csv"
 output_file = sys.argv[2] if len(sys.argv) > 2 else "processed.csv"
 
-with open(input_file, "r") as f:
+with open(input_file, "rb") as f:
     data = f.read()
 
-# Process (simple transformation)
+# Process (simple transformation; bytes.upper() only touches ASCII letters)
 processed = data.upper()
 
-with open(output_file, "w") as f:
+with open(output_file, "wb") as f:
     f.write(processed)
 
 print(f"Processed {input_file} -> {output_file}")
-""")
-    scripts["preprocess"] = preprocess
-
-    # Train script
-    train = temp_git_repo / "train.py"
-    train.write_text("""
-import sys
+""",
+    ),
+    "train": (
+        "train.py",
+        """
+import hashlib
 import json
+import sys
 
 input_file = sys.argv[1] if len(sys.argv) > 1 else "processed.csv"
 output_file = sys.argv[2] if len(sys.argv) > 2 else "model.pkl"
 
-# Parse optional hyperparameters
-lr = 0.01
-epochs = 10
-for arg in sys.argv[1:]:
-    if arg.startswith("--lr="):
-        lr = float(arg.split("=")[1])
-    elif arg.startswith("--epochs="):
-        epochs = int(arg.split("=")[1])
+# Parse optional hyperparameters (--name=value); a missing or empty value
+# keeps the default
+opts = dict(arg[2:].partition("=")[::2] for arg in sys.argv[1:] if arg.startswith("--"))
+lr = float(opts.get("lr") or 0.01)
+epochs = int(opts.get("epochs") or 10)
 
 with open(input_file, "r") as f:
     data = f.read()
 
-# Simulate training
-model = {"data_hash": hash(data), "lr": lr, "epochs": epochs}
+# Simulate training. The digest is stable across interpreters (hash() is
+# salted per process), so identical input and hyperparameters now give an
+# identical model.pkl; tests that expect distinct models vary one of them.
+data_hash = hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+model = {"data_hash": data_hash, "lr": lr, "epochs": epochs}
 
 with open(output_file, "w") as f:
     json.dump(model, f)
 
 print(f"Trained model from {input_file} -> {output_file}")
 print(f"  lr={lr}, epochs={epochs}")
-""")
-    scripts["train"] = train
-
-    # Evaluate script
-    evaluate = temp_git_repo / "evaluate.py"
-    evaluate.write_text("""
+""",
+    ),
+    "evaluate": (
+        "evaluate.py",
+        """
 import sys
 import json
 
@@ -117,15 +119,14 @@ metrics = {
 }
 
 with open(output_file, "w") as f:
-    json.dump(metrics, f, indent=2)
+    f.write(json.dumps(metrics, separators=(",", ":")))
 
 print(f"Evaluated {model_file} on {test_file} -> {output_file}")
-""")
-    scripts["evaluate"] = evaluate
-
-    # Combine script (for diamond/fan-in patterns)
-    combine = temp_git_repo / "combine.py"
-    combine.write_text("""
+""",
+    ),
+    "combine": (
+        "combine.py",
+        """
 import sys
 import json
 
@@ -138,20 +139,22 @@ for i, f in enumerate(input_files):
         combined[f"input_{i}"] = fp.read()
 
 with open(output_file, "w") as f:
-    json.dump(combined, f, indent=2)
+    f.write(json.dumps(combined, separators=(",", ":")))
 
 print(f"Combined {len(input_files)} inputs -> {output_file}")
-""")
-    scripts["combine"] = combine
+""",
+    ),
+}
 
-    # Feature extraction scripts (for fan-out patterns)
-    for name in ["features_a", "features_b", "features_c"]:
-        script = temp_git_repo / f"extract_{name}.py"
-        script.write_text(f'''
+
+# Feature extraction scripts (for fan-out patterns), installed as
+# extract_<name>.py from one shared body; each copy starts with its own
+# feature name, so the scripts stay distinct artifacts
+_EXTRACT_SOURCE = """
 import sys
 
 input_file = sys.argv[1] if len(sys.argv) > 1 else "input.csv"
-output_file = sys.argv[2] if len(sys.argv) > 2 else "{name}.csv"
+output_file = sys.argv[2] if len(sys.argv) > 2 else f"{name}.csv"
 
 with open(input_file, "r") as f:
     data = f.read()
@@ -162,37 +165,124 @@ features = f"{name.upper()}: " + data[:100]
 with open(output_file, "w") as f:
     f.write(features)
 
-print(f"Extracted {name} from {{input_file}} -> {{output_file}}")
-''')
-        scripts[f"extract_{name}"] = script
+print(f"Extracted {name} from {input_file} -> {output_file}")
+"""
+
+for _name in ["features_a", "features_b", "features_c"]:
+    _SCRIPT_SOURCES[f"extract_{_name}"] = (
+        f"extract_{_name}.py",
+        f'name = "{_name}"\n' + _EXTRACT_SOURCE,
+    )
+
+
+# Sample data contents, keyed by fixture name: (filename, content)
+_DATA_SOURCES: dict[str, tuple[str, str]] = {
+    "input": ("input.csv", "id,value\n1,foo\n2,bar\n3,baz\n"),
+    "test": ("test.csv", "id,value\n4,qux\n5,quux\n"),
+}
+
+# Encoded once at import so building the template only writes bytes
+_SCRIPT_BYTES: dict[str, bytes] = {
+    name: source.encode() for name, (_, source) in _SCRIPT_SOURCES.items()
+}
+_DATA_BYTES: dict[str, bytes] = {
+    name: content.encode() for name, (_, content) in _DATA_SOURCES.items()
+}
+
 
-    # Commit the scripts
-    git_commit("Add sample scripts")
+@pytest.fixture(scope="session")
+def _sample_repo_template(
+    _base_git_repo: Path,
+    _repo_copier: Callable[[Path, Path], None],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """
+    Build a repository with the sample scripts and data committed, once per session.
 
-    return scripts
+    Returns:
+        Path to the template repository root (never modified by tests)
+    """
+    template = tmp_path_factory.mktemp("sample_repo")
+    _repo_copier(_base_git_repo, template)
+
+    for name, (filename, _) in _SCRIPT_SOURCES.items():
+        (template / filename).write_bytes(_SCRIPT_BYTES[name])
+    for name, (filename, _) in _DATA_SOURCES.items():
+        (template / filename).write_bytes(_DATA_BYTES[name])
+
+    # One commit for scripts and data together
+    subprocess.run(["git", "add", "-A"], cwd=template, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-q", "-m", "Add sample scripts and data"],
+        cwd=template,
+        capture_output=True,
+        check=True,
+    )
+
+    return template
 
 
 @pytest.fixture
-def sample_data(temp_git_repo: Path, git_commit: Callable) -> dict[str, Path]:
+def sample_repo(
+    temp_git_repo: Path,
+    _sample_repo_template: Path,
+    _repo_copier: Callable[[Path, Path], None],
+) -> dict[str, dict[str, Path]]:
     """
-    Create sample input data files.
+    Provide the sample scripts and data, committed to the repository together.
+
+    Brings temp_git_repo to the committed sample state by copying the
+    session template, so no git commands run per test.
 
     Returns:
-        Dictionary mapping data name to Path
+        Dictionary with "scripts" and "data", each mapping name to Path
     """
-    data_files = {}
+    _repo_copier(_sample_repo_template, temp_git_repo)
+    return {
+        "scripts": {
+            name: temp_git_repo / filename for name, (filename, _) in _SCRIPT_SOURCES.items()
+        },
+        "data": {name: temp_git_repo / filename for name, (filename, _) in _DATA_SOURCES.items()},
+    }
 
-    # Input CSV
-    input_csv = temp_git_repo / "input.csv"
-    input_csv.write_text("id,value\n1,foo\n2,bar\n3,baz\n")
-    data_files["input"] = input_csv
 
-    # Test CSV
-    test_csv = temp_git_repo / "test.csv"
-    test_csv.write_text("id,value\n4,qux\n5,quux\n")
-    data_files["test"] = test_csv
+@pytest.fixture
+def sample_scripts(sample_repo: dict[str, dict[str, Path]]) -> dict[str, Path]:
+    """
+    Provide reusable sample Python scripts, committed to the repository.
 
-    # Commit the data
-    git_commit("Add sample data")
+    Provides scripts for:
+    - preprocess: Reads input.csv, writes processed.csv
+    - train: Reads processed.csv, writes model.pkl
+    - evaluate: Reads model.pkl and test.csv, writes metrics.json
+    - combine: Reads multiple inputs, writes combined output
+    - extract_*: Feature extraction scripts for fan-out patterns
 
-    return data_files
+    Returns:
+        Dictionary mapping script name to Path
+    """
+    return sample_repo["scripts"]
+
+
+@pytest.fixture(scope="session")
+def sample_scripts_bytes() -> Mapping[str, bytes]:
+    """
+    Provide the sample script contents without touching the filesystem.
+
+    For tests that only inspect script text; use sample_scripts to run them.
+
+    Returns:
+        Read-only mapping of script name to its source bytes
+    """
+    return MappingProxyType(_SCRIPT_BYTES)
+
+
+@pytest.fixture
+def sample_data(sample_repo: dict[str, dict[str, Path]]) -> dict[str, Path]:
+    """
+    Provide sample input data files, committed to the repository.
+
+    Returns:
+        Dictionary mapping data name to Path
+    """
+    return sample_repo["data"]
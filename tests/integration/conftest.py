@@ -5,7 +5,7 @@ import sys
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def python_exe() -> str:
     """Return the absolute path to the Python executable."""
     return sys.executable
@@ -820,3 +820,90 @@ class TestInstallPipPackages:
         assert any("Resolved" in c or "Installed" in c for c in calls), (
             "uv stderr output was captured but not displayed to the user"
         )
+
+
+class TestGitCloneCache:
+    """Test cloning through the user-level git mirror cache."""
+
+    @pytest.fixture
+    def upstream(self, tmp_path):
+        """Create a local upstream repository with one commit."""
+        import subprocess
+
+        repo = tmp_path / "upstream"
+        repo.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        (repo / "train.py").write_text("print('hi')\n")
+        subprocess.run(["git", "add", "."], cwd=repo, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init"],
+            cwd=repo,
+            check=True,
+        )
+        return repo
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        return tmp_path / "home" / ".roar" / "cache" / "git"
+
+    @pytest.fixture
+    def cached_service(self):
+        svc = EnvironmentSetupService(use_git_cache=True)
+        svc._logger = MagicMock()
+        return svc
+
+    def test_clone_populates_and_reuses_cache(self, cached_service, upstream, cache_dir, tmp_path):
+        """First clone creates a mirror; later clones reuse it and stay standalone."""
+        first = cached_service._clone_repository(str(upstream), None, tmp_path / "a")
+        mirrors = list(cache_dir.iterdir())
+        assert len(mirrors) == 1
+        assert (first / "train.py").exists()
+
+        second = cached_service._clone_repository(str(upstream), None, tmp_path / "b")
+        assert list(cache_dir.iterdir()) == mirrors
+        assert (second / "train.py").exists()
+        # --dissociate: the clone must not reference the cache's object store
+        assert not (second / ".git" / "objects" / "info" / "alternates").exists()
+
+    def test_prunes_stale_mirrors(self, cached_service, upstream, cache_dir, tmp_path):
+        """Mirrors unused for longer than the max age are removed."""
+        import os
+        import time
+
+        stale = cache_dir / "stale"
+        stale.mkdir(parents=True)
+        old = time.time() - (EnvironmentSetupService.GIT_CACHE_MAX_AGE_DAYS + 1) * 86400
+        os.utime(stale, (old, old))
+
+        cached_service._clone_repository(str(upstream), None, tmp_path / "a")
+
+        assert not stale.exists()
+
+    def test_cache_is_off_by_default(self, service, upstream, cache_dir, tmp_path):
+        """Without use_git_cache no mirror is created."""
+        repo_dir = service._clone_repository(str(upstream), None, tmp_path / "a")
+
+        assert (repo_dir / "train.py").exists()
+        assert not cache_dir.exists()
+
+    def test_failing_remote_is_tried_once_per_url(self, cached_service, cache_dir, tmp_path):
+        """A failed SSH clone goes straight to a plain HTTPS fallback clone."""
+        calls = []
+
+        def fake_run_git(args, cwd=None):
+            calls.append(args)
+            raise RuntimeError("Git command failed: unreachable")
+
+        cached_service._run_git = fake_run_git
+
+        with pytest.raises(RuntimeError):
+            cached_service._clone_repository(
+                "git@example.invalid:team/repo.git", None, tmp_path / "a"
+            )
+
+        assert [args[:2] for args in calls] == [
+            ["clone", "--mirror"],
+            ["clone", "https://example.invalid/team/repo.git"],
+        ]
+        assert list(cache_dir.iterdir()) == []
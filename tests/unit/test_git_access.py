@@ -0,0 +1,146 @@
+"""
+Unit tests for GitAccessService.
+
+Subprocess calls are mocked; no git or ssh processes are spawned.
+"""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from roar.services.vcs.git_access import GitAccessService
+
+
+def _completed(
+    returncode: int = 0, stdout: bytes = b"", stderr: bytes = b""
+) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+class TestCheckPushAccessCache:
+    """Tests for caching of push access checks."""
+
+    URL = "git@github.com:user/repo.git"
+
+    def test_repeated_check_reuses_result(self):
+        """A second check for the same remote and repo spawns nothing."""
+        service = GitAccessService()
+        with patch("subprocess.run", return_value=_completed()) as run:
+            first = service.check_push_access(self.URL, "/repo")
+            second = service.check_push_access(self.URL, "/repo")
+
+        assert first.has_access is True
+        assert second is first
+        assert run.call_count == 1
+
+    def test_different_repo_root_is_checked_separately(self):
+        """The cache is keyed by (git_url, repo_root)."""
+        service = GitAccessService()
+        with patch("subprocess.run", return_value=_completed()) as run:
+            service.check_push_access(self.URL, "/repo-a")
+            service.check_push_access(self.URL, "/repo-b")
+
+        assert run.call_count == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """With cache_ttl=0 every call runs the checks again."""
+        service = GitAccessService(cache_ttl=0)
+        denied = _completed(returncode=1, stderr=b"Permission denied")
+        with patch("subprocess.run", return_value=denied) as run:
+            first = service.check_push_access(self.URL, "/repo")
+            service.check_push_access(self.URL, "/repo")
+
+        assert first.has_access is False
+        assert run.call_count == 2
+
+
+class TestCheckBranchPushed:
+    """Tests for check_branch_pushed via the git CLI."""
+
+    def test_pushed_when_a_remote_branch_contains_head(self):
+        output = _completed(stdout=b"  origin/main\n")
+        with (
+            patch("roar.services.vcs.git_access.pygit2", None),
+            patch("subprocess.run", return_value=output),
+        ):
+            assert GitAccessService().check_branch_pushed("/repo") == (True, None)
+
+    def test_not_pushed_when_no_remote_branch_contains_head(self):
+        with (
+            patch("roar.services.vcs.git_access.pygit2", None),
+            patch("subprocess.run", return_value=_completed(stdout=b"\n")),
+        ):
+            pushed, error = GitAccessService().check_branch_pushed("/repo")
+
+        assert pushed is False
+        assert error == "Current commit hasn't been pushed to remote"
+
+
+class TestCheckBranchPushedPygit2:
+    """Tests for check_branch_pushed when pygit2 is available."""
+
+    def _fake_pygit2(self, remote_targets: dict[str, str], descendants=()):
+        fake = MagicMock()
+        repo = fake.Repository.return_value
+        repo.head.target = "head"
+        branches = {}
+        for name, target in remote_targets.items():
+            branch = MagicMock()
+            branch.resolve.return_value.target = target
+            branches[name] = branch
+        repo.branches.remote = branches
+        repo.descendant_of.side_effect = lambda target, head: target in descendants
+        return fake
+
+    def test_remote_branch_at_head(self):
+        fake = self._fake_pygit2({"origin/main": "head"})
+        with (
+            patch("roar.services.vcs.git_access.pygit2", fake),
+            patch("subprocess.run") as run,
+        ):
+            assert GitAccessService().check_branch_pushed("/repo") == (True, None)
+
+        run.assert_not_called()
+
+    def test_remote_branch_ahead_of_head(self):
+        fake = self._fake_pygit2({"origin/main": "later"}, descendants={"later"})
+        with patch("roar.services.vcs.git_access.pygit2", fake):
+            assert GitAccessService().check_branch_pushed("/repo") == (True, None)
+
+    def test_no_remote_branch_contains_head(self):
+        fake = self._fake_pygit2({"origin/main": "older"})
+        with patch("roar.services.vcs.git_access.pygit2", fake):
+            pushed, _error = GitAccessService().check_branch_pushed("/repo")
+
+        assert pushed is False
+
+    def test_falls_back_to_git_on_libgit2_error(self):
+        fake = MagicMock()
+        fake.Repository.side_effect = RuntimeError("unsupported repository format")
+        output = _completed(stdout=b"  origin/main\n")
+        with (
+            patch("roar.services.vcs.git_access.pygit2", fake),
+            patch("subprocess.run", return_value=output) as run,
+        ):
+            assert GitAccessService().check_branch_pushed("/repo") == (True, None)
+
+        run.assert_called_once()
+
+
+class TestTrySshConnectivity:
+    """Tests for the SSH connectivity fallback."""
+
+    def test_https_url_is_not_tested_over_ssh(self):
+        service = GitAccessService()
+        with patch("subprocess.run") as run:
+            assert service._try_ssh_connectivity("https://github.com/u/r.git", 30) is None
+
+        run.assert_not_called()
+
+    def test_ssh_url_probes_host(self):
+        # ssh -T exits 1 after a successful greeting (no shell access)
+        greeting = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="Hi u!")
+        with patch("subprocess.run", return_value=greeting) as run:
+            result = GitAccessService()._try_ssh_connectivity("ssh://git@gitlab.com/u/r.git", 30)
+
+        assert result is not None and result.has_access is True
+        assert run.call_args.args[0][-1] == "git@gitlab.com"
@@ -4,7 +4,13 @@ Unit tests for git URL utilities.
 Tests SSH URL detection and SSH-to-HTTPS conversion.
 """
 
-from roar.utils.git_url import is_ssh_url, normalize_git_url, ssh_to_https, urls_match
+from roar.utils.git_url import (
+    is_ssh_url,
+    normalize_git_url,
+    ssh_host,
+    ssh_to_https,
+    urls_match,
+)
 
 
 class TestIsSshUrl:
@@ -51,6 +57,22 @@ class TestIsSshUrl:
         assert is_ssh_url("") is False
 
 
+class TestSshHost:
+    """Tests for ssh_host function."""
+
+    def test_scp_format(self):
+        """SCP-like format should yield the host."""
+        assert ssh_host("git@github.com:user/repo.git") == "github.com"
+
+    def test_ssh_scheme(self):
+        """ssh:// scheme should yield the host."""
+        assert ssh_host("ssh://git@gitlab.com/group/repo.git") == "gitlab.com"
+
+    def test_https_url(self):
+        """HTTPS URLs are not SSH and have no SSH host."""
+        assert ssh_host("https://github.com/user/repo.git") is None
+
+
 class TestSshToHttps:
     """Tests for ssh_to_https function."""
 
@@ -145,6 +167,13 @@ class TestNormalizeGitUrl:
     def test_http(self):
         assert normalize_git_url("http://github.com/user/repo.git") == "github.com/user/repo"
 
+    def test_repeated_normalization_is_cached(self):
+        """The same URL is only normalized once."""
+        normalize_git_url.cache_clear()
+        url = "git@github.com:user/cached.git"
+        assert normalize_git_url(url) == normalize_git_url(url)
+        assert normalize_git_url.cache_info().hits == 1
+
 
 class TestUrlsMatch:
     """Tests for urls_match function."""
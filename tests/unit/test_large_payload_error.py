@@ -25,20 +25,20 @@ class TestSizeBasedBatching:
 
     def test_batch_by_size_small_artifacts_single_batch(self):
         """Small artifacts fitting under limit should be in single batch."""
-        from roar.services.registration.artifact import _batch_by_size
+        from roar.services.registration.artifact import batch_by_size
 
         artifacts = [
             {"hashes": [{"algorithm": "blake3", "digest": f"small{i:060d}"}], "size": 100}
             for i in range(100)
         ]
         # 100 small artifacts (~140 bytes each = ~14KB) should fit in one 90KB batch
-        batches = _batch_by_size(artifacts, max_bytes=90 * 1024)
+        batches = batch_by_size(artifacts, max_bytes=90 * 1024)
         assert len(batches) == 1
         assert len(batches[0]) == 100
 
     def test_batch_by_size_splits_at_limit(self):
         """Artifacts should be split when approaching size limit."""
-        from roar.services.registration.artifact import _batch_by_size
+        from roar.services.registration.artifact import batch_by_size
 
         artifacts = [
             {
@@ -49,7 +49,7 @@ class TestSizeBasedBatching:
             for i in range(600)
         ]
 
-        batches = _batch_by_size(artifacts, max_bytes=90 * 1024)
+        batches = batch_by_size(artifacts, max_bytes=90 * 1024)
 
         # Should create multiple batches
         assert len(batches) > 1
@@ -61,26 +61,26 @@ class TestSizeBasedBatching:
 
     def test_batch_by_size_empty_list(self):
         """Empty list should return empty list."""
-        from roar.services.registration.artifact import _batch_by_size
+        from roar.services.registration.artifact import batch_by_size
 
-        assert _batch_by_size([]) == []
+        assert batch_by_size([]) == []
 
     def test_batch_by_size_preserves_order(self):
         """Batching should preserve original order of artifacts."""
-        from roar.services.registration.artifact import _batch_by_size
+        from roar.services.registration.artifact import batch_by_size
 
         artifacts = [
             {"hashes": [{"algorithm": "blake3", "digest": f"order{i:060d}"}], "size": i, "index": i}
             for i in range(200)
         ]
-        batches = _batch_by_size(artifacts, max_bytes=10 * 1024)  # Force multiple batches
+        batches = batch_by_size(artifacts, max_bytes=10 * 1024)  # Force multiple batches
         flattened = [item for batch in batches for item in batch]
         for i, item in enumerate(flattened):
             assert item["index"] == i
 
     def test_batch_by_size_oversized_single_artifact(self):
         """Single artifact exceeding limit should be in its own batch."""
-        from roar.services.registration.artifact import _batch_by_size
+        from roar.services.registration.artifact import batch_by_size
 
         # Create one huge artifact that exceeds the limit
         huge_artifact = {
@@ -94,7 +94,7 @@ class TestSizeBasedBatching:
         }
 
         artifacts = [small_artifact, huge_artifact, small_artifact]
-        batches = _batch_by_size(artifacts, max_bytes=1024)  # 1KB limit
+        batches = batch_by_size(artifacts, max_bytes=1024)  # 1KB limit
 
         # Should have 3 batches: small, huge (alone), small
         assert len(batches) == 3
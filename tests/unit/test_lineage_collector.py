@@ -1,5 +1,6 @@
 """Unit tests for lineage collector service."""
 
+from roar.db.services.lineage import get_blake3, resolve_io
 from roar.services.upload.lineage_collector import LineageCollector, compute_io_signature
 
 
@@ -139,3 +140,200 @@ class TestDeduplicateReruns:
         ]
         result = collector._deduplicate_reruns(jobs)
         assert [j["id"] for j in result] == [1, 2, 3]
+
+    def test_equal_timestamps_keep_first_listed_job(self):
+        """Among re-runs with identical timestamps the first listed job is kept."""
+        collector = LineageCollector()
+        jobs = [
+            {"id": 1, "timestamp": 5.0, "_input_hashes": ["a"], "_output_hashes": ["b"]},
+            {"id": 2, "timestamp": 5.0, "_input_hashes": ["a"], "_output_hashes": ["b"]},
+            {"id": 3, "timestamp": 1.0, "_input_hashes": ["a"], "_output_hashes": ["b"]},
+        ]
+        result = collector._deduplicate_reruns(jobs)
+        assert [j["id"] for j in result] == [1]
+
+    def test_sql_path_matches_python_path(self, tmp_path, monkeypatch):
+        """SQL window-function dedup should keep the same jobs as the Python path."""
+        from roar.db.context import DatabaseContext
+
+        with DatabaseContext(tmp_path / "roar.db") as ctx_db:
+            data_id, _ = ctx_db.artifacts.register({"blake3": "a" * 64}, 1, "data.csv")
+            model_id, _ = ctx_db.artifacts.register({"blake3": "b" * 64}, 1, "model.pt")
+            other_id, _ = ctx_db.artifacts.register({"blake3": "c" * 64}, 1, "other.pt")
+            jobs = []
+            for ts, output_id in ((1.0, model_id), (2.0, model_id), (3.0, other_id)):
+                job_id, _ = ctx_db.jobs.create("python train.py", ts)
+                ctx_db.jobs.add_input(job_id, data_id, "data.csv")
+                ctx_db.jobs.add_output(job_id, output_id, "out")
+                jobs.append(ctx_db.jobs.get(job_id))
+            for ts in (4.0, 5.0):  # no I/O: never deduplicated
+                job_id, _ = ctx_db.jobs.create("make", ts, job_type="build")
+                jobs.append(ctx_db.jobs.get(job_id))
+            hashes = {data_id: "a" * 64, model_id: "b" * 64, other_id: "c" * 64}
+            io = ctx_db.jobs.get_io_for_jobs((j["id"] for j in jobs), ctx_db.artifacts)
+            for job in jobs:
+                job["_input_hashes"] = [hashes[i["artifact_id"]] for i in io[job["id"]]["inputs"]]
+                job["_output_hashes"] = [hashes[o["artifact_id"]] for o in io[job["id"]]["outputs"]]
+
+            collector = LineageCollector()
+            expected = collector._deduplicate_reruns(jobs)
+            monkeypatch.setattr(LineageCollector, "SQL_DEDUP_THRESHOLD", 0)
+            result = collector._deduplicate_reruns(jobs, ctx_db)
+
+        assert [j["timestamp"] for j in result] == [2.0, 3.0, 4.0, 5.0]
+        assert [j["id"] for j in result] == [j["id"] for j in expected]
+
+    def test_sql_path_breaks_ties_by_list_order(self, tmp_path, monkeypatch):
+        """Equal-timestamp re-runs should keep the first listed job, as in Python."""
+        from roar.db.context import DatabaseContext
+
+        with DatabaseContext(tmp_path / "roar.db") as ctx_db:
+            # Register the larger digest first so insertion order differs from sort order
+            second_id, _ = ctx_db.artifacts.register({"blake3": "f" * 64}, 1, "b.csv")
+            first_id, _ = ctx_db.artifacts.register({"blake3": "0" * 64}, 1, "a.csv")
+            jobs = []
+            for inputs in ((second_id, first_id), (first_id, second_id)):
+                job_id, _ = ctx_db.jobs.create("python merge.py", 1.0)
+                for artifact_id in inputs:
+                    ctx_db.jobs.add_input(job_id, artifact_id, "in")
+                job = ctx_db.jobs.get(job_id)
+                job["_input_hashes"] = ["0" * 64, "f" * 64]
+                jobs.append(job)
+            jobs.reverse()
+
+            collector = LineageCollector()
+            expected = collector._deduplicate_reruns(jobs)
+            monkeypatch.setattr(LineageCollector, "SQL_DEDUP_THRESHOLD", 0)
+            result = collector._deduplicate_reruns(jobs, ctx_db)
+
+        assert [j["id"] for j in result] == [j["id"] for j in expected] == [jobs[0]["id"]]
+
+
+class TestGetArtifactInfo:
+    """Tests for _get_artifact_info batched lookup."""
+
+    def test_returns_registered_artifacts_with_lookup_hash(self, tmp_path):
+        """All known hashes should be resolved in one batch; unknown ones skipped."""
+        from roar.db.context import DatabaseContext
+
+        with DatabaseContext(tmp_path / "roar.db") as ctx_db:
+            ctx_db.artifacts.register({"blake3": "a" * 64, "sha256": "b" * 64}, 10, "in.csv")
+            ctx_db.artifacts.register({"blake3": "c" * 64}, 20, "out.csv")
+
+            artifacts = LineageCollector()._get_artifact_info(
+                ctx_db, {"a" * 64, "c" * 64, "d" * 64}
+            )
+
+        by_hash = {a["hash"]: a for a in artifacts}
+        assert set(by_hash) == {"a" * 64, "c" * 64}
+        assert by_hash["a" * 64]["size"] == 10
+        assert {h["algorithm"] for h in by_hash["a" * 64]["hashes"]} == {"blake3", "sha256"}
+        assert by_hash["c" * 64]["first_seen_path"] == "out.csv"
+
+
+class TestLoadBuildJobs:
+    """Tests for _load_build_jobs bulk I/O resolution."""
+
+    def test_populates_io_for_every_build_job(self, tmp_path):
+        """Each build job should get its own inputs/outputs from the bulk lookup."""
+        from roar.db.context import DatabaseContext
+
+        with DatabaseContext(tmp_path / "roar.db") as ctx_db:
+            session_id = ctx_db.sessions.create()
+            src_id, _ = ctx_db.artifacts.register({"blake3": "a" * 64}, 1, "src.c")
+            obj_id, _ = ctx_db.artifacts.register({"blake3": "b" * 64}, 2, "src.o")
+            bin_id, _ = ctx_db.artifacts.register({"blake3": "c" * 64}, 3, "app")
+
+            compile_id, _ = ctx_db.jobs.create(
+                "cc -c src.c", 1.0, session_id=session_id, step_number=1, job_type="build"
+            )
+            ctx_db.jobs.add_input(compile_id, src_id, "src.c")
+            ctx_db.jobs.add_output(compile_id, obj_id, "src.o")
+            link_id, _ = ctx_db.jobs.create(
+                "cc -o app src.o", 2.0, session_id=session_id, step_number=2, job_type="build"
+            )
+            ctx_db.jobs.add_input(link_id, obj_id, "src.o")
+            ctx_db.jobs.add_output(link_id, bin_id, "app")
+
+            collector = LineageCollector()
+            build_jobs = collector._load_build_jobs(ctx_db, {"id": session_id})
+            jobs = collector._merge_build_jobs(build_jobs, [])
+
+        assert [j["id"] for j in jobs] == [compile_id, link_id]
+        assert jobs[0]["_input_hashes"] == ["a" * 64]
+        assert jobs[0]["_outputs"] == [{"hash": "b" * 64, "path": "src.o"}]
+        assert jobs[1]["_input_hashes"] == ["b" * 64]
+        assert jobs[1]["_output_hashes"] == ["c" * 64]
+
+    def test_collect_includes_active_pipeline_build_jobs(self, tmp_path):
+        """Build jobs loaded on the worker connection lead the collected jobs."""
+        from roar.db.context import create_database_context
+
+        with create_database_context(tmp_path) as ctx_db:
+            session_id = ctx_db.sessions.create()
+            bin_id, _ = ctx_db.artifacts.register({"blake3": "b" * 64}, 1, "app")
+            out_id, _ = ctx_db.artifacts.register({"blake3": "c" * 64}, 1, "out.txt")
+            build_id, _ = ctx_db.jobs.create(
+                "make", 1.0, session_id=session_id, step_number=1, job_type="build"
+            )
+            ctx_db.jobs.add_output(build_id, bin_id, "app")
+            run_id, _ = ctx_db.jobs.create("./app", 2.0, session_id=session_id, step_number=2)
+            ctx_db.jobs.add_input(run_id, bin_id, "app")
+            ctx_db.jobs.add_output(run_id, out_id, "out.txt")
+            ctx_db.commit()
+
+        data = LineageCollector().collect(["c" * 64], tmp_path)
+
+        assert data.pipeline["id"] == session_id
+        assert [j["id"] for j in data.jobs] == [build_id, run_id]
+        assert data.artifact_hashes == {"b" * 64, "c" * 64}
+
+
+class TestCollectAllHashes:
+    """Tests for _collect_all_hashes."""
+
+    def test_unions_input_and_output_hashes(self):
+        """All input and output hashes across jobs are collected."""
+        jobs = [
+            {"_input_hashes": ["a"], "_output_hashes": ["b"]},
+            {"_input_hashes": ["b"], "_output_hashes": ["c", "d"]},
+            {},
+        ]
+        assert LineageCollector()._collect_all_hashes(jobs) == {"a", "b", "c", "d"}
+
+
+class TestResolveIo:
+    """Tests for the shared resolve_io helper."""
+
+    def test_keeps_item_order_and_skips_unhashed(self):
+        """Both views follow the items' order; items without BLAKE3 are dropped."""
+        items = [
+            {"hashes": [{"algorithm": "blake3", "digest": "z"}], "path": "z.csv"},
+            {"hashes": [{"algorithm": "sha256", "digest": "s"}], "path": "s.csv"},
+            {"hashes_by_alg": {"blake3": "a"}, "first_seen_path": "a.csv"},
+        ]
+
+        hashes, entries = resolve_io(items)
+
+        assert hashes == ["z", "a"]
+        assert entries == [{"hash": "z", "path": "z.csv"}, {"hash": "a", "path": "a.csv"}]
+
+
+class TestGetBlake3:
+    """Tests for get_blake3 lookup."""
+
+    def test_prefers_hashes_by_alg_index(self):
+        item = {
+            "hashes_by_alg": {"blake3": "x"},
+            "hashes": [{"algorithm": "blake3", "digest": "y"}],
+        }
+        assert get_blake3(item) == "x"
+
+    def test_falls_back_to_hashes_list(self):
+        item = {
+            "hashes": [
+                {"algorithm": "sha256", "digest": "s"},
+                {"algorithm": "blake3", "digest": "b"},
+            ]
+        }
+        assert get_blake3(item) == "b"
@@ -133,3 +133,83 @@ class TestPipelineExecutorDetectRoarExecutable:
             # Should fall back to python -m roar
             expected = f"{sys.executable} -m roar"
             assert executor._roar_executable == expected
+
+
+class TestPipelineExecutorInstallOverlap:
+    """Test overlapping background package install with step execution."""
+
+    @staticmethod
+    def _pipeline(build_steps, run_steps):
+        from roar.core.interfaces.reproduction import PipelineInfo
+
+        return PipelineInfo(
+            artifact_hash="abc",
+            git_repo=None,
+            git_commit=None,
+            build_steps=build_steps,
+            run_steps=run_steps,
+        )
+
+    @staticmethod
+    def _environment(future):
+        from roar.core.interfaces.reproduction import EnvironmentInfo
+
+        return EnvironmentInfo(
+            repo_dir=Path("/tmp/test-repo"),
+            venv_dir=None,
+            python_version=None,
+            install_future=future,
+        )
+
+    def test_build_steps_opting_out_start_before_install_finishes(self):
+        """Build steps with requires_packages false should not wait for the install."""
+        from concurrent.futures import Future
+
+        future: Future = Future()
+        environment = self._environment(future)
+        executor = PipelineExecutor(presenter=MagicMock(), roar_executable="roar")
+        seen_done = []
+
+        def fake_run_step(step, env, is_build=False):
+            seen_done.append((step["command"], future.done()))
+            if not is_build:
+                return True
+            future.set_result((True, []))
+            return True
+
+        executor._run_step = fake_run_step  # type: ignore[method-assign]
+        pipeline = self._pipeline(
+            [{"command": "make", "metadata": '{"requires_packages": false}'}],
+            [{"command": "python train.py"}],
+        )
+
+        steps_run, steps_total = executor.execute(pipeline, environment, auto_confirm=True)
+
+        assert (steps_run, steps_total) == (2, 2)
+        assert seen_done == [("make", False), ("python train.py", True)]
+        assert environment.install_future is None
+
+    def test_build_step_waits_for_install_by_default(self):
+        """A build step without requires_packages metadata should wait for the install."""
+        from concurrent.futures import Future
+
+        future: Future = Future()
+        future.set_result((True, ["Skipped foo==1.0 (exact version not found)"]))
+        environment = self._environment(future)
+        executor = PipelineExecutor(presenter=MagicMock(), roar_executable="roar")
+        executor._logger = MagicMock()
+        seen_pending = []
+
+        def fake_run_step(step, env, is_build=False):
+            seen_pending.append(env.install_future)
+            return True
+
+        executor._run_step = fake_run_step  # type: ignore[method-assign]
+        pipeline = self._pipeline([{"command": "pip install -e ."}], [])
+
+        executor.execute(pipeline, environment, auto_confirm=True)
+
+        assert seen_pending == [None]
+        executor._logger.warning.assert_called_once_with(
+            "Skipped foo==1.0 (exact version not found)"
+        )
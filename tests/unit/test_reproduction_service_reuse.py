@@ -2,10 +2,20 @@
 Tests for ReproductionService reusing the current repo when remotes match.
 """
 
+import os
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 from roar.core.interfaces.reproduction import PipelineInfo
-from roar.services.reproduction.service import ReproductionService
+from roar.services.reproduction.service import ReproductionService, _git_probe_env
+
+
+def _git_proc(stdout="", returncode=0):
+    """Fake Popen object for a finished git probe."""
+    proc = MagicMock(returncode=returncode)
+    proc.communicate.return_value = (stdout, "")
+    return proc
 
 
 def _make_pipeline(**kwargs):
@@ -28,13 +38,14 @@ class TestTryReuseCurrentRepo:
         return ReproductionService(glaas_client=None, presenter=MagicMock())
 
     @patch("roar.services.reproduction.service.subprocess.run")
-    def test_reuses_when_remotes_match(self, mock_run, tmp_path):
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_reuses_when_remotes_match(self, mock_popen, mock_run, tmp_path):
         """Should return EnvironmentInfo when origin matches pipeline remote."""
-        mock_run.side_effect = [
-            MagicMock(stdout=str(tmp_path) + "\n", returncode=0),  # rev-parse
-            MagicMock(stdout="git@github.com:user/repo.git\n", returncode=0),  # get-url
-            MagicMock(returncode=0),  # checkout
+        mock_popen.side_effect = [
+            _git_proc(str(tmp_path) + "\n"),  # rev-parse
+            _git_proc("git@github.com:user/repo.git\n"),  # get-url
         ]
+        mock_run.return_value = MagicMock(returncode=0)  # checkout
 
         svc = self._make_service()
         pipeline = _make_pipeline()
@@ -43,13 +54,15 @@ class TestTryReuseCurrentRepo:
 
         assert result is not None
         assert result.repo_dir == tmp_path
+        # Both probes run from cwd so they can be in flight together
+        assert [c.kwargs["cwd"] for c in mock_popen.call_args_list] == [tmp_path, tmp_path]
 
-    @patch("roar.services.reproduction.service.subprocess.run")
-    def test_returns_none_when_remotes_differ(self, mock_run, tmp_path):
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_returns_none_when_remotes_differ(self, mock_popen, tmp_path):
         """Should return None when origin doesn't match."""
-        mock_run.side_effect = [
-            MagicMock(stdout=str(tmp_path) + "\n", returncode=0),
-            MagicMock(stdout="git@github.com:other/project.git\n", returncode=0),
+        mock_popen.side_effect = [
+            _git_proc(str(tmp_path) + "\n"),
+            _git_proc("git@github.com:other/project.git\n"),
         ]
 
         svc = self._make_service()
@@ -58,12 +71,10 @@ class TestTryReuseCurrentRepo:
         result = svc._try_reuse_current_repo(tmp_path, pipeline)
         assert result is None
 
-    @patch("roar.services.reproduction.service.subprocess.run")
-    def test_returns_none_when_not_in_git_repo(self, mock_run, tmp_path):
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_returns_none_when_not_in_git_repo(self, mock_popen, tmp_path):
         """Should return None when cwd is not inside a git repo."""
-        from subprocess import CalledProcessError
-
-        mock_run.side_effect = CalledProcessError(128, "git")
+        mock_popen.side_effect = [_git_proc(returncode=128), _git_proc(returncode=128)]
 
         svc = self._make_service()
         pipeline = _make_pipeline()
@@ -72,14 +83,15 @@ class TestTryReuseCurrentRepo:
         assert result is None
 
     @patch("roar.services.reproduction.service.subprocess.run")
-    def test_detects_venv(self, mock_run, tmp_path):
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_detects_venv(self, mock_popen, mock_run, tmp_path):
         """Should set venv_dir when .venv exists."""
         (tmp_path / ".venv").mkdir()
-        mock_run.side_effect = [
-            MagicMock(stdout=str(tmp_path) + "\n", returncode=0),
-            MagicMock(stdout="git@github.com:user/repo.git\n", returncode=0),
-            MagicMock(returncode=0),
+        mock_popen.side_effect = [
+            _git_proc(str(tmp_path) + "\n"),
+            _git_proc("git@github.com:user/repo.git\n"),
         ]
+        mock_run.return_value = MagicMock(returncode=0)
 
         svc = self._make_service()
         result = svc._try_reuse_current_repo(tmp_path, _make_pipeline())
@@ -88,13 +100,14 @@ class TestTryReuseCurrentRepo:
         assert result.venv_dir == tmp_path / ".venv"
 
     @patch("roar.services.reproduction.service.subprocess.run")
-    def test_no_venv_when_missing(self, mock_run, tmp_path):
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_no_venv_when_missing(self, mock_popen, mock_run, tmp_path):
         """Should set venv_dir to None when .venv doesn't exist."""
-        mock_run.side_effect = [
-            MagicMock(stdout=str(tmp_path) + "\n", returncode=0),
-            MagicMock(stdout="git@github.com:user/repo.git\n", returncode=0),
-            MagicMock(returncode=0),
+        mock_popen.side_effect = [
+            _git_proc(str(tmp_path) + "\n"),
+            _git_proc("git@github.com:user/repo.git\n"),
         ]
+        mock_run.return_value = MagicMock(returncode=0)
 
         svc = self._make_service()
         result = svc._try_reuse_current_repo(tmp_path, _make_pipeline())
@@ -102,12 +115,12 @@ class TestTryReuseCurrentRepo:
         assert result is not None
         assert result.venv_dir is None
 
-    @patch("roar.services.reproduction.service.subprocess.run")
-    def test_returns_none_when_pipeline_has_no_git_repo(self, mock_run, tmp_path):
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_returns_none_when_pipeline_has_no_git_repo(self, mock_popen, tmp_path):
         """Should return None when pipeline.git_repo is None."""
-        mock_run.side_effect = [
-            MagicMock(stdout=str(tmp_path) + "\n", returncode=0),
-            MagicMock(stdout="git@github.com:user/repo.git\n", returncode=0),
+        mock_popen.side_effect = [
+            _git_proc(str(tmp_path) + "\n"),
+            _git_proc("git@github.com:user/repo.git\n"),
         ]
 
         svc = self._make_service()
@@ -115,3 +128,247 @@ class TestTryReuseCurrentRepo:
 
         result = svc._try_reuse_current_repo(tmp_path, pipeline)
         assert result is None
+        mock_popen.assert_not_called()
+
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_probes_use_minimal_environment(self, mock_popen, tmp_path, monkeypatch):
+        """Git probes should not inherit unrelated environment variables."""
+        monkeypatch.setenv("ROAR_UNRELATED_SECRET", "x")
+        mock_popen.side_effect = [
+            _git_proc(str(tmp_path) + "\n"),
+            _git_proc("git@github.com:other/project.git\n"),
+        ]
+
+        svc = self._make_service()
+        svc._try_reuse_current_repo(tmp_path, _make_pipeline())
+
+        for call in mock_popen.call_args_list:
+            env = call.kwargs["env"]
+            assert "ROAR_UNRELATED_SECRET" not in env
+            assert env["PATH"] == os.environ["PATH"]
+            assert env["GIT_TERMINAL_PROMPT"] == "0"
+            assert env["GIT_OPTIONAL_LOCKS"] == "0"
+
+    def test_probe_env_keeps_git_and_ssh_variables(self, monkeypatch):
+        """Pruning on Linux should keep git, SSH and proxy settings."""
+        monkeypatch.setattr(sys, "platform", "linux")
+        monkeypatch.setenv("GIT_DIR", "/repo/.git")
+        monkeypatch.setenv("SSH_AUTH_SOCK", "/tmp/agent.sock")
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy:3128")
+        monkeypatch.setenv("ROAR_UNRELATED_SECRET", "x")
+
+        env = _git_probe_env()
+
+        assert env["GIT_DIR"] == "/repo/.git"
+        assert env["SSH_AUTH_SOCK"] == "/tmp/agent.sock"
+        assert env["HTTPS_PROXY"] == "http://proxy:3128"
+        assert "ROAR_UNRELATED_SECRET" not in env
+
+    def test_probe_env_is_not_pruned_off_linux(self, monkeypatch):
+        """Other platforms inherit the full environment (e.g. SYSTEMROOT on Windows)."""
+        monkeypatch.setattr(sys, "platform", "win32")
+        monkeypatch.setenv("SYSTEMROOT", "C:\\Windows")
+
+        env = _git_probe_env()
+
+        assert env["SYSTEMROOT"] == "C:\\Windows"
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+
+
+class TestLookupLocal:
+    """Tests for building PipelineInfo from the local database."""
+
+    def test_splits_steps_and_attaches_io(self, tmp_path):
+        """Steps should keep their order and carry their inputs/outputs."""
+        from roar.db.context import create_database_context
+
+        with create_database_context(tmp_path) as ctx:
+            session_id = ctx.sessions.create(git_repo="https://github.com/user/repo.git")
+            src_id, _ = ctx.artifacts.register({"blake3": "a" * 64}, 1, "src.c")
+            bin_id, _ = ctx.artifacts.register({"blake3": "b" * 64}, 1, "app")
+            out_id, _ = ctx.artifacts.register({"blake3": "c" * 64}, 1, "out.txt")
+            build_id, _ = ctx.jobs.create(
+                "make", 1.0, session_id=session_id, step_number=1, job_type="build"
+            )
+            ctx.jobs.add_input(build_id, src_id, "src.c")
+            ctx.jobs.add_output(build_id, bin_id, "app")
+            for step in (2, 3):
+                run_id, _ = ctx.jobs.create(
+                    f"./app {step}", float(step), session_id=session_id, step_number=step
+                )
+                ctx.jobs.add_input(run_id, bin_id, "app")
+            ctx.jobs.add_output(run_id, out_id, "out.txt")
+            ctx.commit()
+
+        svc = ReproductionService(glaas_client=None, presenter=MagicMock())
+        pipeline = svc._lookup_local("c" * 64, tmp_path)
+
+        assert pipeline is not None
+        assert [s["command"] for s in pipeline.build_steps] == ["make"]
+        assert [s["command"] for s in pipeline.run_steps] == ["./app 2", "./app 3"]
+        assert pipeline.total_steps == 3
+        assert [i["path"] for i in pipeline.build_steps[0]["_inputs"]] == ["src.c"]
+        assert [o["path"] for o in pipeline.run_steps[1]["_outputs"]] == ["out.txt"]
+        assert pipeline.run_steps[0]["_outputs"] == []
+        # Paths shared between steps are interned to a single string object
+        assert (
+            pipeline.build_steps[0]["_outputs"][0]["path"]
+            is pipeline.run_steps[0]["_inputs"][0]["path"]
+        )
+        assert not hasattr(pipeline, "__dict__")
+
+    def test_lookup_resolves_producer_and_session_in_one_query(self, tmp_path):
+        """The latest producer and its session come from the joined lookup."""
+        from roar.db.context import create_database_context
+        from roar.db.repositories.artifact import SQLAlchemyArtifactRepository
+
+        with create_database_context(tmp_path) as ctx:
+            session_id = ctx.sessions.create(git_repo="https://github.com/user/repo.git")
+            out_id, _ = ctx.artifacts.register({"blake3": "c" * 64}, 1, "out.txt")
+            old_id, _ = ctx.jobs.create("old", 1.0, step_number=1)
+            ctx.jobs.add_output(old_id, out_id, "out.txt")
+            new_id, _ = ctx.jobs.create("new", 2.0, session_id=session_id, step_number=1)
+            ctx.jobs.add_output(new_id, out_id, "out.txt")
+            ctx.commit()
+
+            producer, session = ctx.artifacts.get_producer_session(out_id)
+            assert producer["id"] == new_id
+            assert session["id"] == session_id
+
+        svc = ReproductionService(glaas_client=None, presenter=MagicMock())
+        with patch.object(
+            SQLAlchemyArtifactRepository,
+            "get_producer_session",
+            autospec=True,
+            side_effect=SQLAlchemyArtifactRepository.get_producer_session,
+        ) as spy:
+            pipeline = svc._lookup_local("c" * 64, tmp_path)
+
+        assert spy.call_count == 1
+        assert pipeline.git_repo == "https://github.com/user/repo.git"
+
+
+class TestLookupRemote:
+    """Tests for fetching the artifact and its DAG from GLaaS."""
+
+    def _make_service(self, client):
+        return ReproductionService(glaas_client=client, presenter=MagicMock())
+
+    def test_fetches_artifact_and_dag_concurrently(self):
+        """The DAG request should not wait for the artifact request."""
+        started = threading.Barrier(2, timeout=5)
+        client = MagicMock()
+
+        def get_artifact(hash_prefix):
+            started.wait()
+            return {"hash": "a" * 64}, None
+
+        def get_artifact_dag(hash_prefix):
+            started.wait()
+            return {"gitRepo": "repo", "jobs": [{"jobType": "build"}, {"jobType": "run"}]}, None
+
+        client.get_artifact.side_effect = get_artifact
+        client.get_artifact_dag.side_effect = get_artifact_dag
+
+        pipeline, error = self._make_service(client)._lookup_remote("aaaa", None)
+
+        assert error is None
+        assert pipeline.artifact_hash == "a" * 64
+        assert len(pipeline.build_steps) == 1
+        assert len(pipeline.run_steps) == 1
+
+    def test_artifact_error_takes_precedence(self):
+        """An artifact lookup error should be reported over a DAG error."""
+        client = MagicMock()
+        client.get_artifact.return_value = (None, "artifact failed")
+        client.get_artifact_dag.return_value = (None, "dag failed")
+
+        assert self._make_service(client)._lookup_remote("aaaa", None) == (None, "artifact failed")
+
+    def test_missing_artifact_is_not_an_error(self):
+        """A missing artifact should return no pipeline and no error."""
+        client = MagicMock()
+        client.get_artifact.return_value = (None, None)
+        client.get_artifact_dag.return_value = (None, "not found")
+
+        assert self._make_service(client)._lookup_remote("aaaa", None) == (None, None)
+
+
+class TestProbeRepoPygit2:
+    """Tests for resolving the repo in-process when pygit2 is available."""
+
+    def _fake_pygit2(self, workdir, origin_url="git@github.com:user/repo.git"):
+        fake = MagicMock()
+        fake.discover_repository.return_value = f"{workdir}/.git/"
+        repo = fake.Repository.return_value
+        repo.workdir = f"{workdir}/"
+        repo.remotes = {"origin": MagicMock(url=origin_url)} if origin_url else {}
+        return fake
+
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_uses_pygit2_without_spawning_git(self, mock_popen, tmp_path):
+        """Should resolve root and origin via pygit2 and skip the git probes."""
+        fake = self._fake_pygit2(tmp_path)
+        svc = ReproductionService(glaas_client=None, presenter=MagicMock())
+
+        with patch("roar.services.reproduction.service.pygit2", fake):
+            assert svc._probe_repo(tmp_path) == (str(tmp_path), "git@github.com:user/repo.git")
+
+        mock_popen.assert_not_called()
+
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_missing_origin_returns_none(self, mock_popen, tmp_path):
+        """A repo without an origin remote cannot be reused."""
+        fake = self._fake_pygit2(tmp_path, origin_url=None)
+        svc = ReproductionService(glaas_client=None, presenter=MagicMock())
+
+        with patch("roar.services.reproduction.service.pygit2", fake):
+            assert svc._probe_repo(tmp_path) is None
+
+        mock_popen.assert_not_called()
+
+    @patch("roar.services.reproduction.service.subprocess.Popen")
+    def test_falls_back_to_git_on_libgit2_error(self, mock_popen, tmp_path):
+        """Errors from libgit2 should fall back to the git CLI probes."""
+        fake = MagicMock()
+        fake.Repository.side_effect = RuntimeError("unsupported repository format")
+        mock_popen.side_effect = [
+            _git_proc(str(tmp_path) + "\n"),
+            _git_proc("git@github.com:user/repo.git\n"),
+        ]
+        svc = ReproductionService(glaas_client=None, presenter=MagicMock())
+
+        with patch("roar.services.reproduction.service.pygit2", fake):
+            assert svc._probe_repo(tmp_path) == (str(tmp_path), "git@github.com:user/repo.git")
+
+        assert mock_popen.call_count == 2
+
+
+class TestListRequirements:
+    """Tests for the --list-requirements package listing."""
+
+    def test_listing_is_printed_in_one_call(self, tmp_path):
+        """All package sections should be rendered into a single print."""
+        presenter = MagicMock()
+        presenter.confirm.return_value = False
+        svc = ReproductionService(glaas_client=None, presenter=presenter)
+        svc._lookup_pipeline = MagicMock(return_value=(_make_pipeline(), None))
+        svc._env_setup._get_build_dpkg_packages = MagicMock(return_value={"cmake"})
+        svc._env_setup._get_dpkg_packages = MagicMock(return_value=set())
+        svc._env_setup._get_packages = MagicMock(return_value=["numpy==1.0", "attrs==2.0"])
+
+        svc.reproduce(
+            "abc123",
+            server_url=None,
+            run_pipeline=False,
+            auto_confirm=False,
+            roar_dir=tmp_path,
+            cwd=tmp_path,
+            list_requirements=True,
+        )
+
+        listings = [c.args[0] for c in presenter.print.call_args_list if "  - " in c.args[0]]
+        assert listings == [
+            "\nBuild tool packages (1):\n  - cmake\n"
+            "\nPip packages (2):\n  - attrs==2.0\n  - numpy==1.0"
+        ]
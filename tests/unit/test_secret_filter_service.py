@@ -0,0 +1,61 @@
+"""Unit tests for SecretFilterService construction from config."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from roar.services.secrets import filter_service
+from roar.services.secrets.filter_service import SecretFilterService
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    filter_service._build_omit_filter.cache_clear()
+    yield
+    filter_service._build_omit_filter.cache_clear()
+
+
+def _write_config(root, secret: str):
+    config = root / ".roar" / "config.toml"
+    config.parent.mkdir(exist_ok=True)
+    config.write_text(f'[registration.omit.secrets]\nvalues = ["{secret}"]\n')
+    return config
+
+
+class TestFromConfig:
+    """Tests for the memoized from_config constructor."""
+
+    def test_repeated_calls_load_config_once(self, tmp_path, monkeypatch):
+        _write_config(tmp_path, "hunter2")
+        monkeypatch.chdir(tmp_path)
+
+        with patch.object(filter_service, "config_get", wraps=filter_service.config_get) as spy:
+            first = SecretFilterService.from_config()
+            second = SecretFilterService.from_config()
+
+        assert spy.call_count == 1
+        assert first._filter is second._filter
+        assert first.filter_command("echo hunter2")[0] == "echo [REDACTED]"
+
+    def test_edited_config_is_reloaded(self, tmp_path, monkeypatch):
+        config = _write_config(tmp_path, "hunter2")
+        monkeypatch.chdir(tmp_path)
+        SecretFilterService.from_config()
+
+        _write_config(tmp_path, "swordfish")
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        service = SecretFilterService.from_config()
+        assert service.filter_command("echo swordfish")[0] == "echo [REDACTED]"
+
+    def test_env_override_is_picked_up(self, tmp_path, monkeypatch):
+        _write_config(tmp_path, "hunter2")
+        monkeypatch.chdir(tmp_path)
+        SecretFilterService.from_config()
+
+        monkeypatch.setenv("ROAR_REGISTRATION__OMIT__SECRETS__VALUES", '["swordfish"]')
+
+        service = SecretFilterService.from_config()
+        assert service.filter_command("echo swordfish")[0] == "echo [REDACTED]"
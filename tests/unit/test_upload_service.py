@@ -0,0 +1,289 @@
+"""
+Unit tests for UploadService file uploads.
+
+Uses a mocked cloud provider; no network or database access.
+"""
+
+from pathlib import Path
+from typing import Any, ClassVar
+from unittest.mock import MagicMock
+
+from roar.core.interfaces.cloud import ICloudStorageProvider
+from roar.services.upload.service import UploadService
+
+
+def _cloud(failing: set[str] | None = None) -> MagicMock:
+    """Create a mock cloud provider whose uploads fail for the given names."""
+    failing = failing or set()
+    cloud = MagicMock()
+    cloud.exists.return_value = False
+    cloud.upload.side_effect = lambda src, dest, show_progress=True: (
+        (False, "boom") if Path(src).name in failing else (True, None)
+    )
+    return cloud
+
+
+class TestUploadFiles:
+    """Test UploadService._upload_files."""
+
+    SOURCES: ClassVar[list[Path]] = [Path(f"/data/file{i}.csv") for i in range(5)]
+
+    def test_uploads_every_source_concurrently(self):
+        """All sources are uploaded to the destination prefix."""
+        cloud = _cloud()
+        service = UploadService(cloud_provider=cloud, max_workers=4)
+
+        count, failure = service._upload_files(self.SOURCES, "s3://bucket/path/", False)
+
+        assert count == 5
+        assert failure is None
+        uploaded = sorted(call.args[1] for call in cloud.upload.call_args_list)
+        assert uploaded == [f"s3://bucket/path/file{i}.csv" for i in range(5)]
+
+    def test_progress_bars_only_for_sequential_uploads(self):
+        """Concurrent uploads hide per-file progress bars so they don't interleave."""
+        for workers, expected in ((4, False), (1, True)):
+            cloud = _cloud()
+            service = UploadService(cloud_provider=cloud, max_workers=workers)
+
+            service._upload_files(self.SOURCES, "s3://bucket/path/", False)
+
+            shown = {call.kwargs["show_progress"] for call in cloud.upload.call_args_list}
+            assert shown == {expected}
+
+    def test_reports_failed_source(self):
+        """A failed upload is reported with its source path and error."""
+        cloud = _cloud(failing={"file2.csv"})
+        service = UploadService(cloud_provider=cloud, max_workers=4)
+
+        count, failure = service._upload_files(self.SOURCES, "s3://bucket", False)
+
+        assert failure == (Path("/data/file2.csv"), "boom")
+        assert count < 5
+
+    def test_single_worker_stops_at_first_failure(self):
+        """With one worker, uploads run in order and stop at the failure."""
+        cloud = _cloud(failing={"file1.csv"})
+        service = UploadService(cloud_provider=cloud, max_workers=1)
+
+        count, failure = service._upload_files(self.SOURCES, "s3://bucket", False)
+
+        assert count == 1
+        assert failure == (Path("/data/file1.csv"), "boom")
+        assert cloud.upload.call_count == 2
+
+
+class TestPrefetchExisting:
+    """Test UploadService._prefetch_existing and its use by _upload_file."""
+
+    def _service(self, objects: list[str], ok: bool = True) -> UploadService:
+        cloud = _cloud()
+        cloud.list_objects.return_value = (ok, objects, "" if ok else "denied")
+        cloud.parse_url.return_value = ("bucket", "path")
+        return UploadService(cloud_provider=cloud)
+
+    def test_normalizes_listed_objects(self):
+        """URLs, bucket keys and bare names all map to destination URLs."""
+        service = self._service(["s3://bucket/path/a.csv", "path/b.csv", "c.csv", "path/sub/d.csv"])
+
+        existing = service._prefetch_existing("s3://bucket/path/")
+
+        assert existing == {
+            "s3://bucket/path/a.csv",
+            "s3://bucket/path/b.csv",
+            "s3://bucket/path/c.csv",
+        }
+
+    def test_failed_listing_falls_back_to_per_file_checks(self):
+        """A failed listing returns None so exists() is used per file."""
+        service = self._service([], ok=False)
+
+        assert service._prefetch_existing("s3://bucket/path") is None
+
+    def test_prefetched_keys_skip_exists_and_upload(self):
+        """A source already in the listing is neither checked nor uploaded."""
+        service = self._service([])
+        cloud = service._cloud
+
+        ok, error = service._upload_file(
+            Path("/data/a.csv"), "s3://bucket/path", False, {"s3://bucket/path/a.csv"}
+        )
+
+        assert (ok, error) == (True, None)
+        cloud.exists.assert_not_called()
+        cloud.upload.assert_not_called()
+
+    def test_force_skips_existence_check(self):
+        """With force, the file is uploaded without checking exists()."""
+        cloud = _cloud()
+        cloud.exists.return_value = True
+        service = UploadService(cloud_provider=cloud)
+
+        ok, _error = service._upload_file(Path("/data/a.csv"), "s3://bucket/path", True)
+
+        assert ok is True
+        cloud.exists.assert_not_called()
+        cloud.upload.assert_called_once_with(
+            "/data/a.csv", "s3://bucket/path/a.csv", show_progress=True
+        )
+
+    def test_default_exists_matches_listed_url_or_key(self):
+        """The interface's exists() falls back to an exact listing match."""
+        cloud = _cloud()
+        cloud.parse_url.return_value = ("bucket", "path/a.csv")
+        cloud.list_objects.return_value = (True, ["path/a.csv.bak", "path/a.csv"], "")
+
+        assert ICloudStorageProvider.exists(cloud, "s3://bucket/path/a.csv") is True
+
+        cloud.list_objects.return_value = (True, ["path/a.csv.bak"], "")
+        assert ICloudStorageProvider.exists(cloud, "s3://bucket/path/a.csv") is False
+
+
+class TestIndexOutputsByPath:
+    """Test UploadService._index_outputs_by_path."""
+
+    def test_keeps_most_recent_artifact_per_path(self):
+        """Outputs are newest first, so the first artifact per path wins."""
+        ctx = MagicMock()
+        new = {"artifact_id": "new", "path": "/data/a.csv"}
+        other = {"artifact_id": "b", "path": "/data/b.csv"}
+        old = {"artifact_id": "old", "path": "/data/a.csv"}
+        ctx.artifacts.get_all_outputs_with_paths.return_value = [new, other, old]
+
+        by_path = UploadService()._index_outputs_by_path(ctx)
+
+        assert by_path == {"/data/a.csv": new, "/data/b.csv": other}
+        ctx.artifacts.get_all_outputs_with_paths.assert_called_once_with()
+
+
+class TestUploadAndRegister:
+    """Test UploadService.upload_and_register orchestration."""
+
+    def _service(self, cloud: MagicMock, hashes: list[str]) -> UploadService:
+        service = UploadService(cloud_provider=cloud)
+        service._get_local_hashes = MagicMock(return_value=hashes)
+        service._lineage_collector = MagicMock()
+        service._lineage_collector.collect.return_value.jobs = [{"id": 1}]
+        return service
+
+    def test_collects_lineage_alongside_upload(self, tmp_path):
+        """Lineage is collected once, for the local hashes, during upload."""
+        src = tmp_path / "data.csv"
+        src.write_text("a,b\n")
+        service = self._service(_cloud(), ["abc"])
+
+        result = service.upload_and_register(
+            [src], "s3://bucket/path", False, None, None, tmp_path / ".roar"
+        )
+
+        assert result.success is True
+        assert result.artifacts_uploaded == 1
+        assert result.lineage_jobs == 1
+        service._lineage_collector.collect.assert_called_once_with(["abc"], tmp_path / ".roar")
+
+    def test_upload_failure_is_reported(self, tmp_path):
+        """An upload failure still wins over a successful lineage collection."""
+        src = tmp_path / "data.csv"
+        src.write_text("a,b\n")
+        service = self._service(_cloud(failing={"data.csv"}), ["abc"])
+
+        result = service.upload_and_register(
+            [src], "s3://bucket/path", False, None, None, tmp_path / ".roar"
+        )
+
+        assert result.success is False
+        assert result.error == f"Upload failed for {src}: boom"
+
+    def test_prefix_is_listed_only_for_many_files(self, tmp_path, monkeypatch):
+        """Small uploads check exists() per file instead of listing the prefix."""
+        src = tmp_path / "data.csv"
+        src.write_text("a,b\n")
+        for threshold, listed in ((2, False), (1, True)):
+            monkeypatch.setattr(UploadService, "PREFETCH_THRESHOLD", threshold)
+            cloud = _cloud()
+            cloud.list_objects.return_value = (True, [], "")
+            cloud.parse_url.return_value = ("bucket", "path")
+            service = self._service(cloud, ["abc"])
+
+            service.upload_and_register(
+                [src], "s3://bucket/path", False, None, None, tmp_path / ".roar"
+            )
+
+            assert cloud.list_objects.called is listed
+            assert cloud.exists.called is not listed
+
+
+class TestRegisterArtifacts:
+    """Test UploadService._register_artifacts."""
+
+    ARTIFACTS: ClassVar[list[dict[str, Any]]] = [
+        {"hashes": [{"algorithm": "blake3", "digest": "a"}], "size": 1},
+        {"hashes": [{"algorithm": "blake3", "digest": "b"}], "size": None},
+        {"hashes": [{"algorithm": "blake3", "digest": "c"}], "size": "3"},
+        {"hashes": [{"algorithm": "blake3", "digest": "d"}], "size": 4},
+    ]
+
+    def test_registers_sized_artifacts_in_one_batch(self):
+        """Artifacts with a size are sent in a single batch request."""
+        glaas = MagicMock()
+        glaas.register_artifacts_batch.return_value = (3, 0, None)
+        service = UploadService(glaas_client=glaas)
+        warnings: list[str] = []
+
+        count = service._register_artifacts(self.ARTIFACTS, "output", "sess", "s3://b/p", warnings)
+
+        assert count == 3
+        assert warnings == []
+        (batch,), _ = glaas.register_artifacts_batch.call_args
+        assert [p["size"] for p in batch] == [1, 3, 4]
+        assert all(p["session_hash"] == "sess" and p["source_url"] == "s3://b/p" for p in batch)
+        glaas.register_artifact.assert_not_called()
+
+    def test_reports_artifacts_rejected_in_batch(self):
+        """Per-artifact rejections from a successful batch become a warning."""
+        glaas = MagicMock()
+        glaas.register_artifacts_batch.return_value = (2, 1, None)
+        service = UploadService(glaas_client=glaas)
+        warnings: list[str] = []
+
+        count = service._register_artifacts(self.ARTIFACTS, "output", "sess", None, warnings)
+
+        assert count == 2
+        assert warnings == ["GLaaS rejected 1 of 3 artifacts"]
+
+    def test_falls_back_to_individual_registration(self):
+        """A failed batch request is retried one artifact at a time."""
+        for error in ("HTTP 404: Not Found", "HTTP 422: invalid hashes", "HTTP 503: busy"):
+            glaas = MagicMock()
+            glaas.register_artifacts_batch.return_value = (0, 3, error)
+            glaas.register_artifact.side_effect = lambda **kw: (
+                (False, "conflict") if kw["size"] == 4 else (True, None)
+            )
+            service = UploadService(glaas_client=glaas, register_workers=4)
+            warnings: list[str] = []
+
+            count = service._register_artifacts(self.ARTIFACTS, "output", "sess", None, warnings)
+
+            assert count == 2
+            sizes = sorted(call.kwargs["size"] for call in glaas.register_artifact.call_args_list)
+            assert sizes == [1, 3, 4]
+            for call in glaas.register_artifact.call_args_list:
+                assert "source_url" not in call.kwargs
+            assert len(warnings) == 1
+            assert "1 of 3 artifacts also failed individually" in warnings[0]
+
+    def test_auth_error_stops_with_warning(self):
+        """Auth and connection failures are not retried per artifact but are reported."""
+        for error in ("HTTP 401: Unauthorized", "HTTP 403: Forbidden", "Connection error"):
+            glaas = MagicMock()
+            glaas.register_artifacts_batch.return_value = (0, 3, error)
+            service = UploadService(glaas_client=glaas)
+            warnings: list[str] = []
+
+            count = service._register_artifacts(self.ARTIFACTS, "output", "sess", None, warnings)
+
+            assert count == 0
+            glaas.register_artifact.assert_not_called()
+            assert warnings == [
+                f"Artifact registration stopped: {error} (3 of 3 artifacts not registered)"
+            ]